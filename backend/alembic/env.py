@@ -6,6 +6,7 @@ from sqlalchemy import engine_from_config
 from sqlalchemy import pool
 
 from alembic import context
+from alembic.runtime.migration import MigrationContext
 
 # Add the src directory to the Python path so we can import our models
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
@@ -15,7 +16,7 @@ from models.base import Base
 from models.user_profile import UserProfile
 from models.scenario import Scenario
 from models.strategy import Strategy
-from models.advice_outcome import AdviceOutcome
+from models.advice_outcome import AdviceOutcome, AdviceOutcomeKey
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -91,6 +92,13 @@ def run_migrations_online() -> None:
     )
 
     with connectable.connect() as connection:
+        # Bootstrapping an empty database runs only one-shot DDL, which never
+        # benefits from PostgreSQL's JIT; turn it off for this session.
+        # (psycopg2 has no client-side statement cache to disable.)
+        if MigrationContext.configure(connection).get_current_revision() is None:
+            connection.exec_driver_sql("SET jit = off")
+        connection.commit()
+
         context.configure(
             connection=connection, target_metadata=target_metadata
         )
@@ -9,6 +9,8 @@ from typing import Sequence, Union
 
 from alembic import op
 import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateIndex, CreateTable, DropTable
 
 # revision identifiers, used by Alembic.
 revision: str = '001_initial'
@@ -17,9 +19,10 @@ branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
 
-def upgrade() -> None:
-    # Create user_profiles table
-    op.create_table('user_profiles',
+def _define_tables(metadata: sa.MetaData) -> None:
+    """Declare the initial tables and their indexes on ``metadata``."""
+    # user_profiles table
+    user_profiles = sa.Table('user_profiles', metadata,
         sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
         sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
         sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), onupdate=sa.text('now()'), nullable=False),
@@ -28,27 +31,33 @@ def upgrade() -> None:
         sa.Column('first_name', sa.String(length=100), nullable=True),
         sa.Column('last_name', sa.String(length=100), nullable=True),
         sa.Column('display_name', sa.String(length=200), nullable=True),
-        sa.Column('role', sa.String(length=50), nullable=False),
-        sa.Column('is_active', sa.Boolean(), nullable=False),
+        sa.Column('role', sa.String(length=50), server_default='CLIENT', nullable=False),
+        sa.Column('is_active', sa.Boolean(), server_default=sa.true(), nullable=False),
         sa.Column('organization_id', sa.String(length=255), nullable=True),
         sa.Column('organization_name', sa.String(length=255), nullable=True),
         sa.Column('afsl_number', sa.String(length=50), nullable=True),
         sa.Column('aflp_number', sa.String(length=50), nullable=True),
-        sa.Column('certification_expiry', sa.String(length=10), nullable=True),
-        sa.Column('permissions', sa.JSON(), nullable=True),
-        sa.Column('preferences', sa.JSON(), nullable=True),
-        sa.Column('last_login_at', sa.String(length=25), nullable=True),
+        sa.Column('certification_expiry', sa.Date(), nullable=True),
+        sa.Column('permissions', postgresql.JSONB(), nullable=True),
+        sa.Column('preferences', postgresql.JSONB(), nullable=True),
+        sa.Column('last_login_at', sa.DateTime(timezone=True), nullable=True),
         sa.Column('created_by_clerk_id', sa.String(length=255), nullable=True),
         sa.PrimaryKeyConstraint('id'),
         sa.UniqueConstraint('clerk_id'),
         sa.UniqueConstraint('email')
     )
-    op.create_index(op.f('ix_user_profiles_clerk_id'), 'user_profiles', ['clerk_id'], unique=False)
-    op.create_index(op.f('ix_user_profiles_email'), 'user_profiles', ['email'], unique=False)
-    op.create_index(op.f('ix_user_profiles_organization_id'), 'user_profiles', ['organization_id'], unique=False)
+    sa.Index('ix_user_profiles_clerk_id', user_profiles.c.clerk_id)
+    sa.Index('ix_user_profiles_email', user_profiles.c.email)
+    sa.Index('ix_user_profiles_organization_id', user_profiles.c.organization_id)
+    # BRIN suits append-mostly timestamps: tiny index, block-range pruning.
+    sa.Index('ix_user_profiles_last_login_at_brin', user_profiles.c.last_login_at, postgresql_using='brin')
+    # GIN(jsonb_path_ops) only on JSONB columns filtered with @> containment;
+    # large or rarely-filtered documents are left unindexed to limit write cost.
+    sa.Index('ix_user_profiles_permissions_gin', user_profiles.c.permissions,
+             postgresql_using='gin', postgresql_ops={'permissions': 'jsonb_path_ops'})
 
-    # Create strategies table
-    op.create_table('strategies',
+    # strategies table
+    strategies = sa.Table('strategies', metadata,
         sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
         sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
         sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), onupdate=sa.text('now()'), nullable=False),
@@ -57,20 +66,24 @@ def upgrade() -> None:
         sa.Column('description', sa.Text(), nullable=True),
         sa.Column('domain', sa.String(length=50), nullable=False),
         sa.Column('target_metric', sa.String(length=50), nullable=False),
-        sa.Column('constraints', sa.JSON(), nullable=True),
-        sa.Column('parameters', sa.JSON(), nullable=True),
-        sa.Column('is_active', sa.Boolean(), nullable=False),
-        sa.Column('is_template', sa.Boolean(), nullable=False),
-        sa.Column('version', sa.String(length=20), nullable=False),
-        sa.Column('tags', sa.JSON(), nullable=True),
+        sa.Column('constraints', postgresql.JSONB(), nullable=True),
+        sa.Column('parameters', postgresql.JSONB(), nullable=True),
+        sa.Column('is_active', sa.Boolean(), server_default=sa.true(), nullable=False),
+        sa.Column('is_template', sa.Boolean(), server_default=sa.true(), nullable=False),
+        sa.Column('version', sa.String(length=20), server_default='1.0', nullable=False),
+        sa.Column('tags', postgresql.JSONB(), nullable=True),
         sa.Column('created_by_clerk_id', sa.String(length=255), nullable=False),
         sa.Column('updated_by_clerk_id', sa.String(length=255), nullable=True),
         sa.PrimaryKeyConstraint('id'),
         sa.UniqueConstraint('strategy_id')
     )
+    sa.Index('ix_strategies_constraints_gin', strategies.c.constraints,
+             postgresql_using='gin', postgresql_ops={'constraints': 'jsonb_path_ops'})
+    sa.Index('ix_strategies_tags_gin', strategies.c.tags,
+             postgresql_using='gin', postgresql_ops={'tags': 'jsonb_path_ops'})
 
-    # Create scenarios table
-    op.create_table('scenarios',
+    # scenarios table
+    scenarios = sa.Table('scenarios', metadata,
         sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
         sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
         sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), onupdate=sa.text('now()'), nullable=False),
@@ -78,51 +91,141 @@ def upgrade() -> None:
         sa.Column('name', sa.String(length=255), nullable=False),
         sa.Column('description', sa.Text(), nullable=True),
         sa.Column('user_profile_id', sa.Integer(), nullable=False),
-        sa.Column('status', sa.String(length=50), nullable=False),
-        sa.Column('version', sa.String(length=20), nullable=False),
-        sa.Column('calculation_state', sa.JSON(), nullable=True),
-        sa.Column('assumption_set', sa.JSON(), nullable=True),
-        sa.Column('strategy_config', sa.JSON(), nullable=True),
-        sa.Column('mode', sa.String(length=100), nullable=False),
-        sa.Column('projection_output', sa.JSON(), nullable=True),
-        sa.Column('last_calculated_at', sa.String(length=25), nullable=True),
-        sa.Column('tags', sa.JSON(), nullable=True),
-        sa.Column('metadata', sa.JSON(), nullable=True),
+        sa.Column('status', sa.String(length=50), server_default='DRAFT', nullable=False),
+        sa.Column('version', sa.String(length=20), server_default='1.0', nullable=False),
+        sa.Column('calculation_state', postgresql.JSONB(), nullable=True),
+        sa.Column('assumption_set', postgresql.JSONB(), nullable=True),
+        sa.Column('strategy_config', postgresql.JSONB(), nullable=True),
+        sa.Column('mode', sa.String(length=100), server_default='MODE-FACT-CHECK', nullable=False),
+        sa.Column('projection_output', postgresql.JSONB(), nullable=True),
+        sa.Column('last_calculated_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('tags', postgresql.JSONB(), nullable=True),
+        sa.Column('metadata', postgresql.JSONB(), nullable=True),
         sa.Column('created_by_clerk_id', sa.String(length=255), nullable=False),
         sa.Column('updated_by_clerk_id', sa.String(length=255), nullable=True),
         sa.ForeignKeyConstraint(['user_profile_id'], ['user_profiles.id'], ),
         sa.PrimaryKeyConstraint('id'),
         sa.UniqueConstraint('scenario_id')
     )
-    op.create_index(op.f('ix_scenarios_user_profile_id'), 'scenarios', ['user_profile_id'], unique=False)
+    # Composite indexes match the "scenarios for a user [with status], newest
+    # first" and "outcomes for a scenario by verdict" access paths.
+    sa.Index('ix_scenarios_user_status_updated', scenarios.c.user_profile_id,
+             scenarios.c.status, scenarios.c.updated_at.desc())
+    sa.Index('ix_scenarios_last_calculated_at_brin', scenarios.c.last_calculated_at, postgresql_using='brin')
+    sa.Index('ix_scenarios_tags_gin', scenarios.c.tags,
+             postgresql_using='gin', postgresql_ops={'tags': 'jsonb_path_ops'})
+    sa.Index('ix_scenarios_metadata_gin', scenarios.c.metadata,
+             postgresql_using='gin', postgresql_ops={'metadata': 'jsonb_path_ops'})
+
+    # advice_outcome_keys table: one row per advice_outcome_id ever issued.
+    # advice_outcomes is partitioned, so it cannot carry a UNIQUE constraint on
+    # advice_outcome_id alone; this unpartitioned table enforces it instead.
+    sa.Table('advice_outcome_keys', metadata,
+        sa.Column('advice_outcome_id', sa.String(length=255), nullable=False),
+        sa.PrimaryKeyConstraint('advice_outcome_id')
+    )
 
-    # Create advice_outcomes table
-    op.create_table('advice_outcomes',
+    # advice_outcomes table
+    advice_outcomes = sa.Table('advice_outcomes', metadata,
         sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
         sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
         sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), onupdate=sa.text('now()'), nullable=False),
         sa.Column('advice_outcome_id', sa.String(length=255), nullable=False),
         sa.Column('scenario_id', sa.Integer(), nullable=False),
         sa.Column('best_interest_duty_passed', sa.String(length=10), nullable=False),
-        sa.Column('compliance_warnings', sa.JSON(), nullable=True),
-        sa.Column('regulatory_citations', sa.JSON(), nullable=True),
-        sa.Column('risk_warnings', sa.JSON(), nullable=True),
+        sa.Column('compliance_warnings', postgresql.JSONB(), nullable=True),
+        sa.Column('regulatory_citations', postgresql.JSONB(), nullable=True),
+        sa.Column('risk_warnings', postgresql.JSONB(), nullable=True),
         sa.Column('suitability_score', sa.Float(), nullable=True),
-        sa.Column('approved_strategies', sa.JSON(), nullable=True),
-        sa.Column('rejected_strategies', sa.JSON(), nullable=True),
-        sa.Column('assessment_details', sa.JSON(), nullable=True),
+        sa.Column('approved_strategies', postgresql.JSONB(), nullable=True),
+        sa.Column('rejected_strategies', postgresql.JSONB(), nullable=True),
+        sa.Column('assessment_details', postgresql.JSONB(), nullable=True),
         sa.Column('assessed_by_clerk_id', sa.String(length=255), nullable=False),
-        sa.Column('assessment_version', sa.String(length=20), nullable=False),
+        sa.Column('assessment_version', sa.String(length=20), server_default='1.0', nullable=False),
         sa.ForeignKeyConstraint(['scenario_id'], ['scenarios.id'], ),
-        sa.PrimaryKeyConstraint('id'),
-        sa.UniqueConstraint('advice_outcome_id')
+        sa.ForeignKeyConstraint(['advice_outcome_id'], ['advice_outcome_keys.advice_outcome_id'], ),
+        # Partitioned tables need the partition key in every unique constraint;
+        # advice_outcome_id uniqueness is enforced through advice_outcome_keys.
+        sa.PrimaryKeyConstraint('id', 'created_at'),
+        postgresql_partition_by='RANGE (created_at)'
     )
-    op.create_index(op.f('ix_advice_outcomes_scenario_id'), 'advice_outcomes', ['scenario_id'], unique=False)
+    sa.Index('ix_advice_outcomes_advice_outcome_id', advice_outcomes.c.advice_outcome_id)
+    sa.Index('ix_advice_outcomes_scenario_verdict', advice_outcomes.c.scenario_id,
+             advice_outcomes.c.best_interest_duty_passed)
+    sa.Index('ix_advice_outcomes_approved_strategies_gin', advice_outcomes.c.approved_strategies,
+             postgresql_using='gin', postgresql_ops={'approved_strategies': 'jsonb_path_ops'})
+    sa.Index('ix_advice_outcomes_rejected_strategies_gin', advice_outcomes.c.rejected_strategies,
+             postgresql_using='gin', postgresql_ops={'rejected_strategies': 'jsonb_path_ops'})
+
+
+_RESERVE_ADVICE_OUTCOME_ID_FUNCTION = """CREATE FUNCTION reserve_advice_outcome_id() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP = 'INSERT' OR NEW.advice_outcome_id IS DISTINCT FROM OLD.advice_outcome_id THEN
+        INSERT INTO advice_outcome_keys (advice_outcome_id) VALUES (NEW.advice_outcome_id);
+    END IF;
+    RETURN NEW;
+END
+$$"""
+
+
+def _compile_upgrade_ddl(metadata: sa.MetaData, dialect: sa.engine.Dialect) -> str:
+    """Render every CREATE TABLE / CREATE INDEX plus storage tweaks as one script."""
+    statements = []
+    for table in metadata.sorted_tables:
+        statements.append(str(CreateTable(table).compile(dialect=dialect)).strip())
+        for index in sorted(table.indexes, key=lambda ix: ix.name):
+            statements.append(str(CreateIndex(index).compile(dialect=dialect)).strip())
+
+    # advice_outcomes is append-only and read by recency, so it is range
+    # partitioned by created_at. Rows land in the DEFAULT partition until
+    # monthly partitions are created (see src/models/partitions.py).
+    statements.append("CREATE TABLE advice_outcomes_default PARTITION OF advice_outcomes DEFAULT")
+
+    # Every insert (or change) of advice_outcome_id first reserves the id in
+    # advice_outcome_keys, whose primary key rejects duplicates across all
+    # partitions. Ids stay reserved after the outcome row is deleted.
+    statements.append(_RESERVE_ADVICE_OUTCOME_ID_FUNCTION)
+    statements.append(
+        "CREATE TRIGGER trg_advice_outcomes_reserve_id "
+        "BEFORE INSERT OR UPDATE OF advice_outcome_id ON advice_outcomes "
+        "FOR EACH ROW EXECUTE FUNCTION reserve_advice_outcome_id()"
+    )
+
+    # Small, frequently read JSONB stays inline (MAIN) to avoid a TOAST fetch;
+    # large projection/state snapshots stay EXTENDED but use LZ4 (PG14+).
+    for column in ('strategy_config', 'assumption_set'):
+        statements.append(f"ALTER TABLE scenarios ALTER COLUMN {column} SET STORAGE MAIN")
+    for column in ('calculation_state', 'projection_output'):
+        statements.append(f"ALTER TABLE scenarios ALTER COLUMN {column} SET COMPRESSION lz4")
+
+    return ";\n\n".join(statements)
+
+
+def _compile_downgrade_ddl(metadata: sa.MetaData, dialect: sa.engine.Dialect) -> str:
+    """Render DROP TABLE statements in reverse dependency order as one script."""
+    statements = [
+        str(DropTable(table).compile(dialect=dialect)).strip()
+        for table in reversed(metadata.sorted_tables)
+    ]
+    statements.append("DROP FUNCTION IF EXISTS reserve_advice_outcome_id()")
+    return ";\n\n".join(statements)
+
+
+# The schema is PostgreSQL-only (JSONB, GIN/BRIN, partitioning), so the DDL
+# is compiled once at import rather than on every upgrade()/downgrade() call.
+_METADATA = sa.MetaData()
+_define_tables(_METADATA)
+_UPGRADE_DDL = _compile_upgrade_ddl(_METADATA, postgresql.dialect())
+_DOWNGRADE_DDL = _compile_downgrade_ddl(_METADATA, postgresql.dialect())
+
+
+def upgrade() -> None:
+    # Send the pre-compiled script in a single round-trip instead of one per
+    # op.create_* call.
+    op.execute(sa.text(_UPGRADE_DDL))
 
 
 def downgrade() -> None:
     # Drop tables in reverse order to handle foreign keys
-    op.drop_table('advice_outcomes')
-    op.drop_table('scenarios')
-    op.drop_table('strategies')
-    op.drop_table('user_profiles')
+    op.execute(sa.text(_DOWNGRADE_DDL))
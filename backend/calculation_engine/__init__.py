@@ -7,21 +7,13 @@ calculations on CalculationState inputs, maintaining separation from AI probabil
 All calculation functions are now organized in domain modules and accessed via the Registry.
 """
 
-from decimal import Decimal
-from typing import Optional, Any
+from functools import lru_cache
+from typing import Any, Callable
 from calculation_engine.schemas.calculation import CalculationState
 from calculation_engine.schemas.orchestration import TraceEntry
-from .registry import run_calculation as _run_calculation
-
-# Import calculation result schema for backward compatibility
-# TODO: This should be moved to shared/schemas once defined
-class CalculationResult:
-    """Result of a CAL execution."""
-    def __init__(self, success: bool, value: Optional[Decimal], trace_entries: list[TraceEntry], error_message: Optional[str] = None):
-        self.success = success
-        self.value = value
-        self.trace_entries = trace_entries
-        self.error_message = error_message
+# Re-exported for backward compatibility
+from calculation_engine.schemas.calculation_result import CalculationResult
+from .registry import get_calculation
 
 
 def run_calculation(cal_id: str, *args, **kwargs) -> Any:
@@ -42,54 +34,75 @@ def run_calculation(cal_id: str, *args, **kwargs) -> Any:
     Raises:
         KeyError: If the CAL-ID is not registered
     """
-    return _run_calculation(cal_id, *args, **kwargs)
+    return _resolve_calculation(cal_id)(*args, **kwargs)
+
+
+@lru_cache(maxsize=None)
+def _resolve_calculation(cal_id: str) -> Callable[..., Any]:
+    """Resolve a CAL-ID to its function once; registered entries are never replaced."""
+    return get_calculation(cal_id)
+
+
+# Resolve the built-in CAL-IDs once at import so the wrappers below skip the lookup
+_CAL_PIT_001 = _resolve_calculation("CAL-PIT-001")
+_CAL_PIT_002 = _resolve_calculation("CAL-PIT-002")
+_CAL_PIT_004 = _resolve_calculation("CAL-PIT-004")
+_CAL_PIT_005 = _resolve_calculation("CAL-PIT-005")
+_CAL_CGT_001 = _resolve_calculation("CAL-CGT-001")
+_CAL_CGT_002 = _resolve_calculation("CAL-CGT-002")
+_CAL_SUP_002 = _resolve_calculation("CAL-SUP-002")
+_CAL_SUP_003 = _resolve_calculation("CAL-SUP-003")
+_CAL_SUP_007 = _resolve_calculation("CAL-SUP-007")
+_CAL_SUP_008 = _resolve_calculation("CAL-SUP-008")
+_CAL_SUP_009 = _resolve_calculation("CAL-SUP-009")
+_CAL_PFL_104 = _resolve_calculation("CAL-PFL-104")
 
 
 # For backward compatibility, expose individual functions via delegation
 def run_CAL_PIT_001(*args, **kwargs):
     """Calculate PAYG tax for residents."""
-    return run_calculation("CAL-PIT-001", *args, **kwargs)
+    return _CAL_PIT_001(*args, **kwargs)
 
 def run_CAL_PIT_002(*args, **kwargs):
     """Calculate Medicare levy."""
-    return run_calculation("CAL-PIT-002", *args, **kwargs)
+    return _CAL_PIT_002(*args, **kwargs)
 
 def run_CAL_PIT_004(*args, **kwargs):
     """Aggregate tax offsets."""
-    return run_calculation("CAL-PIT-004", *args, **kwargs)
+    return _CAL_PIT_004(*args, **kwargs)
 
 def run_CAL_PIT_005(*args, **kwargs):
     """Calculate net tax payable/refund."""
-    return run_calculation("CAL-PIT-005", *args, **kwargs)
+    return _CAL_PIT_005(*args, **kwargs)
 
 def run_CAL_CGT_001(*args, **kwargs):
     """Calculate capital gain/loss on asset disposal."""
-    return run_calculation("CAL-CGT-001", *args, **kwargs)
+    return _CAL_CGT_001(*args, **kwargs)
 
 def run_CAL_CGT_002(*args, **kwargs):
     """Apply CGT discount for individuals."""
-    return run_calculation("CAL-CGT-002", *args, **kwargs)
+    return _CAL_CGT_002(*args, **kwargs)
 
 def run_CAL_SUP_002(*args, **kwargs):
     """Calculate total concessional contributions."""
-    return run_calculation("CAL-SUP-002", *args, **kwargs)
+    return _CAL_SUP_002(*args, **kwargs)
 
 def run_CAL_SUP_003(*args, **kwargs):
     """Check concessional contributions cap utilisation."""
-    return run_calculation("CAL-SUP-003", *args, **kwargs)
+    return _CAL_SUP_003(*args, **kwargs)
 
 def run_CAL_SUP_007(*args, **kwargs):
     """Calculate contributions tax inside super."""
-    return run_calculation("CAL-SUP-007", *args, **kwargs)
+    return _CAL_SUP_007(*args, **kwargs)
 
 def run_CAL_SUP_008(*args, **kwargs):
     """Calculate Division 293 additional tax."""
-    return run_calculation("CAL-SUP-008", *args, **kwargs)
+    return _CAL_SUP_008(*args, **kwargs)
 
 def run_CAL_SUP_009(*args, **kwargs):
     """Calculate net contribution added to balance."""
-    return run_calculation("CAL-SUP-009", *args, **kwargs)
+    return _CAL_SUP_009(*args, **kwargs)
 
 def run_CAL_PFL_104(*args, **kwargs):
     """Calculate negative gearing tax benefit."""
-    return run_calculation("CAL-PFL-104", *args, **kwargs)
+    return _CAL_PFL_104(*args, **kwargs)
@@ -4,23 +4,40 @@ Capital Gains Tax Calculations - CAL-CGT-* functions.
 This module contains calculations for capital gains tax, including:
 - CAL-CGT-001: Capital gain/loss on asset disposal
 - CAL-CGT-002: CGT discount for individuals
+
+Batch variants (``*_batch``) operate on float64 NumPy arrays of
+(entity x year) values for projection loops; the scalar functions remain
+the Decimal-based registry entry points.
 """
 
 from decimal import Decimal
-from typing import Optional
+import numpy as np
+from numba import njit, prange
 from calculation_engine.schemas.calculation import CalculationState
 from calculation_engine.schemas.orchestration import TraceEntry
-from src.services.rule_loader import rule_loader
+from calculation_engine.schemas.calculation_result import CalculationResult
+from src.services.rule_loader import CalculationRules, rule_loader
+
+_ZERO = Decimal("0")
+
+# Rule constants, rebound by rule_loader whenever the rule files change
+_CGT_DISCOUNT_RATE = _ZERO
+_CGT_DISCOUNT_FACTOR = Decimal("1")
+_CGT_DISCOUNT_RATE_FLOAT = 0.0
+
+
+def _bind_rules(rules: CalculationRules) -> None:
+    """Specialise this module to the loaded CGT rules."""
+    global _CGT_DISCOUNT_RATE, _CGT_DISCOUNT_FACTOR, _CGT_DISCOUNT_RATE_FLOAT
+    _CGT_DISCOUNT_RATE = rules.capital_gains.individual_discount_rate
+    _CGT_DISCOUNT_FACTOR = Decimal("1") - _CGT_DISCOUNT_RATE
+    _CGT_DISCOUNT_RATE_FLOAT = float(_CGT_DISCOUNT_RATE)
+
+
+rule_loader.on_reload(_bind_rules)
 
-# Import calculation result schema
-# TODO: This should be in shared/schemas once defined
-class CalculationResult:
-    """Result of a CAL execution."""
-    def __init__(self, success: bool, value: Optional[Decimal], trace_entries: list[TraceEntry], error_message: Optional[str] = None):
-        self.success = success
-        self.value = value
-        self.trace_entries = trace_entries
-        self.error_message = error_message
+# Shared result for the untraced placeholder path of CAL-CGT-001
+_CGT001_ZERO_RESULT = CalculationResult(success=True, value=_ZERO, trace_entries=())
 
 
 def run_CAL_CGT_001(
@@ -38,28 +55,29 @@ def run_CAL_CGT_001(
 
         # For MVP, we'll assume asset disposal data is in the financial position context
         # This is a placeholder - real implementation would need asset disposal events
-        capital_gain = Decimal("0")  # Placeholder
+        capital_gain = _ZERO  # Placeholder
 
         # In a real scenario, this would calculate:
         # capital_gain = proceeds - (cost_base - reductions)
 
+        # Update state intermediates
+        state.intermediates.cgt_results.capital_gain = capital_gain
+
+        # No disposal events yet: skip allocating a result when nothing is traced
+        if not state.trace_enabled:
+            return _CGT001_ZERO_RESULT
+
         trace_entry = TraceEntry(
             calc_id="CAL-CGT-001",
             entity_id=entity_id,
             field="capital_gain",
             explanation="Capital gain/loss calculated on asset disposal (MVP placeholder)",
             metadata={
-                "proceeds": Decimal("0"),
-                "cost_base": Decimal("0"),
+                "proceeds": _ZERO,
+                "cost_base": _ZERO,
                 "capital_gain": capital_gain
             }
         )
-
-        # Update state intermediates
-        if "cgt_results" not in state.intermediates:
-            state.intermediates.cgt_results = {}
-
-        state.intermediates.cgt_results["capital_gain"] = capital_gain
         state.intermediates.trace_log.append(trace_entry)
 
         return CalculationResult(
@@ -88,34 +106,35 @@ def run_CAL_CGT_002(
     """
     try:
         # Get capital gain from previous calculation
-        capital_gain = state.intermediates.cgt_results.get("capital_gain", Decimal("0"))
-
-        # Apply CGT discount for individuals (loaded from rules)
-        discount_rate = rule_loader.get_cgt_discount_rate()
-        cgt_discount = capital_gain * discount_rate
-        discounted_gain = capital_gain - cgt_discount
+        capital_gain = state.intermediates.cgt_results.capital_gain
 
-        trace_entry = TraceEntry(
-            calc_id="CAL-CGT-002",
-            entity_id=entity_id,
-            field="discounted_capital_gain",
-            explanation=f"50% CGT discount applied to capital gain of {capital_gain}",
-            metadata={
-                "original_gain": capital_gain,
-                "discount_rate": discount_rate,
-                "discount_amount": cgt_discount,
-                "discounted_gain": discounted_gain
-            }
-        )
+        # Apply CGT discount for individuals (rate bound from rules)
+        discounted_gain = capital_gain * _CGT_DISCOUNT_FACTOR
 
         # Update state intermediates
-        state.intermediates.cgt_results["discounted_gain"] = discounted_gain
-        state.intermediates.trace_log.append(trace_entry)
+        state.intermediates.cgt_results.discounted_gain = discounted_gain
+
+        trace_entries = []
+        if state.trace_enabled:
+            trace_entry = TraceEntry(
+                calc_id="CAL-CGT-002",
+                entity_id=entity_id,
+                field="discounted_capital_gain",
+                explanation=f"50% CGT discount applied to capital gain of {capital_gain}",
+                metadata={
+                    "original_gain": capital_gain,
+                    "discount_rate": _CGT_DISCOUNT_RATE,
+                    "discount_amount": capital_gain - discounted_gain,
+                    "discounted_gain": discounted_gain
+                }
+            )
+            state.intermediates.trace_log.append(trace_entry)
+            trace_entries.append(trace_entry)
 
         return CalculationResult(
             success=True,
             value=discounted_gain,
-            trace_entries=[trace_entry]
+            trace_entries=trace_entries
         )
 
     except Exception as e:
@@ -125,3 +144,32 @@ def run_CAL_CGT_002(
             trace_entries=[],
             error_message=f"Error in CAL-CGT-002: {str(e)}"
         )
+
+
+def run_CAL_CGT_002_batch(
+    state: CalculationState,
+    capital_gains: np.ndarray
+) -> np.ndarray:
+    """
+    Apply CGT discount for individuals to a batch of capital gains.
+    CAL-CGT-002 (batch): vectorised float64 variant for projections
+
+    Args:
+        state: Calculation state for the batch
+        capital_gains: Capital gains, e.g. shape (n_entities, n_years)
+
+    Returns:
+        Discounted gains with the same shape as capital_gains
+    """
+    gains = np.ascontiguousarray(capital_gains, dtype=np.float64)
+    out = np.empty_like(gains)
+    _cgt_discount_kernel(gains.reshape(-1), _CGT_DISCOUNT_RATE_FLOAT, out.reshape(-1))
+    return out
+
+
+@njit(parallel=True, cache=True)
+def _cgt_discount_kernel(gains, discount_rate, out):
+    """Compiled inner loop for CAL-CGT-002 batch: out = gains * (1 - rate)."""
+    retained = 1.0 - discount_rate
+    for i in prange(gains.shape[0]):
+        out[i] = gains[i] * retained
@@ -3,23 +3,33 @@ Property Investment Calculations - CAL-PFL-* functions.
 
 This module contains calculations for property investment, including:
 - CAL-PFL-104: Negative gearing tax benefit
+
+Batch variants (``*_batch``) operate on float64 NumPy arrays of
+(entity x year) values for projection loops; the scalar functions remain
+the Decimal-based registry entry points.
 """
 
 from decimal import Decimal
-from typing import Optional
+import numpy as np
+from numba import njit, prange
 from calculation_engine.schemas.calculation import CalculationState
 from calculation_engine.schemas.orchestration import TraceEntry
-from src.services.rule_loader import rule_loader
+from calculation_engine.schemas.calculation_result import CalculationResult
+from src.services.rule_loader import CalculationRules, rule_loader
+
+# Rule constants, rebound by rule_loader whenever the rule files change
+_MARGINAL_TAX_RATE = Decimal("0")
+_MARGINAL_TAX_RATE_FLOAT = 0.0
+
+
+def _bind_rules(rules: CalculationRules) -> None:
+    """Specialise this module to the loaded property rules."""
+    global _MARGINAL_TAX_RATE, _MARGINAL_TAX_RATE_FLOAT
+    _MARGINAL_TAX_RATE = rules.property.marginal_tax_rate
+    _MARGINAL_TAX_RATE_FLOAT = float(_MARGINAL_TAX_RATE)
 
-# Import calculation result schema
-# TODO: This should be in shared/schemas once defined
-class CalculationResult:
-    """Result of a CAL execution."""
-    def __init__(self, success: bool, value: Optional[Decimal], trace_entries: list[TraceEntry], error_message: Optional[str] = None):
-        self.success = success
-        self.value = value
-        self.trace_entries = trace_entries
-        self.error_message = error_message
+
+rule_loader.on_reload(_bind_rules)
 
 
 def run_CAL_PFL_104(
@@ -45,37 +55,37 @@ def run_CAL_PFL_104(
         # Only calculate tax benefit if there's a loss
         tax_benefit = Decimal("0")
 
-        # Load marginal tax rate from rules
-        marginal_rate = rule_loader.get_marginal_tax_rate()
+        # Marginal tax rate bound from rules
+        marginal_rate = _MARGINAL_TAX_RATE
 
         if deductible_loss > 0:
             tax_benefit = deductible_loss * marginal_rate
 
-        trace_entry = TraceEntry(
-            calc_id="CAL-PFL-104",
-            entity_id=entity_id,
-            field="negative_gearing_benefit",
-            explanation=f"Negative gearing tax benefit calculated: {tax_benefit}",
-            metadata={
-                "property_interest": property_interest,
-                "rental_income": rental_income,
-                "deductible_loss": deductible_loss,
-                "marginal_rate": marginal_rate,
-                "tax_benefit": tax_benefit
-            }
-        )
-
         # Update state intermediates
-        if "property_results" not in state.intermediates:
-            state.intermediates.property_results = {}
+        state.intermediates.property_results.negative_gearing_benefit = tax_benefit
 
-        state.intermediates.property_results["negative_gearing_benefit"] = tax_benefit
-        state.intermediates.trace_log.append(trace_entry)
+        trace_entries = []
+        if state.trace_enabled:
+            trace_entry = TraceEntry(
+                calc_id="CAL-PFL-104",
+                entity_id=entity_id,
+                field="negative_gearing_benefit",
+                explanation=f"Negative gearing tax benefit calculated: {tax_benefit}",
+                metadata={
+                    "property_interest": property_interest,
+                    "rental_income": rental_income,
+                    "deductible_loss": deductible_loss,
+                    "marginal_rate": marginal_rate,
+                    "tax_benefit": tax_benefit
+                }
+            )
+            state.intermediates.trace_log.append(trace_entry)
+            trace_entries.append(trace_entry)
 
         return CalculationResult(
             success=True,
             value=tax_benefit,
-            trace_entries=[trace_entry]
+            trace_entries=trace_entries
         )
 
     except Exception as e:
@@ -85,3 +95,41 @@ def run_CAL_PFL_104(
             trace_entries=[],
             error_message=f"Error in CAL-PFL-104: {str(e)}"
         )
+
+
+def run_CAL_PFL_104_batch(
+    state: CalculationState,
+    property_interest: np.ndarray,
+    rental_income: np.ndarray
+) -> np.ndarray:
+    """
+    Calculate negative gearing tax benefit for a batch of properties/years.
+    CAL-PFL-104 (batch): vectorised float64 variant for projections
+
+    Args:
+        state: Calculation state for the batch
+        property_interest: Deductible loan interest, e.g. shape (n_entities, n_years)
+        rental_income: Rental income, broadcastable against property_interest
+
+    Returns:
+        Tax benefit array in the broadcast shape (zero where there is no deductible loss)
+    """
+    # The kernel walks flat buffers element by element, so broadcast first
+    # (numpy raises on incompatible shapes) and materialise contiguous copies
+    interest, rent = np.broadcast_arrays(
+        np.asarray(property_interest, dtype=np.float64),
+        np.asarray(rental_income, dtype=np.float64),
+    )
+    interest = np.ascontiguousarray(interest)
+    rent = np.ascontiguousarray(rent)
+    out = np.empty_like(interest)
+    _neg_gearing_kernel(interest.reshape(-1), rent.reshape(-1), _MARGINAL_TAX_RATE_FLOAT, out.reshape(-1))
+    return out
+
+
+@njit(parallel=True, cache=True)
+def _neg_gearing_kernel(interest, rent, marginal_rate, out):
+    """Compiled inner loop for CAL-PFL-104 batch: max(interest - rent, 0) * rate."""
+    for i in prange(interest.shape[0]):
+        deductible_loss = interest[i] - rent[i]
+        out[i] = deductible_loss * marginal_rate if deductible_loss > 0.0 else 0.0
@@ -10,21 +10,11 @@ This module contains calculations for superannuation contributions and taxes, in
 """
 
 from decimal import Decimal
-from typing import Optional
 from calculation_engine.schemas.calculation import CalculationState
 from calculation_engine.schemas.orchestration import TraceEntry
+from calculation_engine.schemas.calculation_result import CalculationResult
 from src.services.rule_loader import rule_loader
 
-# Import calculation result schema
-# TODO: This should be in shared/schemas once defined
-class CalculationResult:
-    """Result of a CAL execution."""
-    def __init__(self, success: bool, value: Optional[Decimal], trace_entries: list[TraceEntry], error_message: Optional[str] = None):
-        self.success = success
-        self.value = value
-        self.trace_entries = trace_entries
-        self.error_message = error_message
-
 
 def run_CAL_SUP_002(
     state: CalculationState,
@@ -53,30 +43,33 @@ def run_CAL_SUP_002(
 
         total_concessional = employer_sg + salary_sacrifice + personal_deductible
 
-        trace_entry = TraceEntry(
-            calc_id="CAL-SUP-002",
-            entity_id=entity_id,
-            field="total_concessional_contributions",
-            explanation=f"Total concessional contributions calculated: {total_concessional}",
-            metadata={
-                "employer_sg": employer_sg,
-                "salary_sacrifice": salary_sacrifice,
-                "personal_deductible": personal_deductible,
-                "total": total_concessional
-            }
-        )
+        trace_entries = []
+        if state.trace_enabled:
+            trace_entry = TraceEntry(
+                calc_id="CAL-SUP-002",
+                entity_id=entity_id,
+                field="total_concessional_contributions",
+                explanation=f"Total concessional contributions calculated: {total_concessional}",
+                metadata={
+                    "employer_sg": employer_sg,
+                    "salary_sacrifice": salary_sacrifice,
+                    "personal_deductible": personal_deductible,
+                    "total": total_concessional
+                }
+            )
+            state.intermediates.trace_log.append(trace_entry)
+            trace_entries.append(trace_entry)
 
         # Update state intermediates
         if "super_results" not in state.intermediates:
             state.intermediates.super_results = {}
 
         state.intermediates.super_results["total_concessional"] = total_concessional
-        state.intermediates.trace_log.append(trace_entry)
 
         return CalculationResult(
             success=True,
             value=total_concessional,
-            trace_entries=[trace_entry]
+            trace_entries=trace_entries
         )
 
     except Exception as e:
@@ -107,29 +100,32 @@ def run_CAL_SUP_003(
         remaining = max(Decimal("0"), concessional_cap - utilised)
         excess = max(Decimal("0"), utilised - concessional_cap)
 
-        trace_entry = TraceEntry(
-            calc_id="CAL-SUP-003",
-            entity_id=entity_id,
-            field="concessional_cap_utilisation",
-            explanation=f"Concessional cap utilisation: {utilised} of {concessional_cap} cap",
-            metadata={
-                "cap_limit": concessional_cap,
-                "utilised": utilised,
-                "remaining": remaining,
-                "excess": excess
-            }
-        )
+        trace_entries = []
+        if state.trace_enabled:
+            trace_entry = TraceEntry(
+                calc_id="CAL-SUP-003",
+                entity_id=entity_id,
+                field="concessional_cap_utilisation",
+                explanation=f"Concessional cap utilisation: {utilised} of {concessional_cap} cap",
+                metadata={
+                    "cap_limit": concessional_cap,
+                    "utilised": utilised,
+                    "remaining": remaining,
+                    "excess": excess
+                }
+            )
+            state.intermediates.trace_log.append(trace_entry)
+            trace_entries.append(trace_entry)
 
         # Update state intermediates
         state.intermediates.super_results["concessional_cap_utilised"] = utilised
         state.intermediates.super_results["concessional_cap_remaining"] = remaining
         state.intermediates.super_results["concessional_cap_excess"] = excess
-        state.intermediates.trace_log.append(trace_entry)
 
         return CalculationResult(
             success=True,
             value=utilised,
-            trace_entries=[trace_entry]
+            trace_entries=trace_entries
         )
 
     except Exception as e:
@@ -157,26 +153,29 @@ def run_CAL_SUP_007(
         contributions_tax_rate = rule_loader.get_contributions_tax_rate()
         contributions_tax = total_concessional * contributions_tax_rate
 
-        trace_entry = TraceEntry(
-            calc_id="CAL-SUP-007",
-            entity_id=entity_id,
-            field="contributions_tax",
-            explanation=f"15% contributions tax calculated on concessional contributions",
-            metadata={
-                "concessional_contributions": total_concessional,
-                "tax_rate": contributions_tax_rate,
-                "tax_amount": contributions_tax
-            }
-        )
+        trace_entries = []
+        if state.trace_enabled:
+            trace_entry = TraceEntry(
+                calc_id="CAL-SUP-007",
+                entity_id=entity_id,
+                field="contributions_tax",
+                explanation=f"15% contributions tax calculated on concessional contributions",
+                metadata={
+                    "concessional_contributions": total_concessional,
+                    "tax_rate": contributions_tax_rate,
+                    "tax_amount": contributions_tax
+                }
+            )
+            state.intermediates.trace_log.append(trace_entry)
+            trace_entries.append(trace_entry)
 
         # Update state intermediates
         state.intermediates.super_results["contributions_tax"] = contributions_tax
-        state.intermediates.trace_log.append(trace_entry)
 
         return CalculationResult(
             success=True,
             value=contributions_tax,
-            trace_entries=[trace_entry]
+            trace_entries=trace_entries
         )
 
     except Exception as e:
@@ -215,27 +214,30 @@ def run_CAL_SUP_008(
             total_concessional = state.intermediates.super_results.get("total_concessional", Decimal("0"))
             additional_tax = total_concessional * additional_rate
 
-        trace_entry = TraceEntry(
-            calc_id="CAL-SUP-008",
-            entity_id=entity_id,
-            field="division_293_tax",
-            explanation=f"Division 293 tax calculated for ATI of {ati}",
-            metadata={
-                "adjusted_taxable_income": ati,
-                "threshold": div293_threshold,
-                "additional_rate": additional_rate,
-                "additional_tax": additional_tax
-            }
-        )
+        trace_entries = []
+        if state.trace_enabled:
+            trace_entry = TraceEntry(
+                calc_id="CAL-SUP-008",
+                entity_id=entity_id,
+                field="division_293_tax",
+                explanation=f"Division 293 tax calculated for ATI of {ati}",
+                metadata={
+                    "adjusted_taxable_income": ati,
+                    "threshold": div293_threshold,
+                    "additional_rate": additional_rate,
+                    "additional_tax": additional_tax
+                }
+            )
+            state.intermediates.trace_log.append(trace_entry)
+            trace_entries.append(trace_entry)
 
         # Update state intermediates
         state.intermediates.super_results["division_293_tax"] = additional_tax
-        state.intermediates.trace_log.append(trace_entry)
 
         return CalculationResult(
             success=True,
             value=additional_tax,
-            trace_entries=[trace_entry]
+            trace_entries=trace_entries
         )
 
     except Exception as e:
@@ -265,28 +267,31 @@ def run_CAL_SUP_009(
         total_taxes = contributions_tax + division_293_tax
         net_contribution = total_concessional - total_taxes
 
-        trace_entry = TraceEntry(
-            calc_id="CAL-SUP-009",
-            entity_id=entity_id,
-            field="net_super_contribution",
-            explanation=f"Net super contribution calculated after taxes: {net_contribution}",
-            metadata={
-                "gross_contributions": total_concessional,
-                "contributions_tax": contributions_tax,
-                "division_293_tax": division_293_tax,
-                "total_taxes": total_taxes,
-                "net_contribution": net_contribution
-            }
-        )
+        trace_entries = []
+        if state.trace_enabled:
+            trace_entry = TraceEntry(
+                calc_id="CAL-SUP-009",
+                entity_id=entity_id,
+                field="net_super_contribution",
+                explanation=f"Net super contribution calculated after taxes: {net_contribution}",
+                metadata={
+                    "gross_contributions": total_concessional,
+                    "contributions_tax": contributions_tax,
+                    "division_293_tax": division_293_tax,
+                    "total_taxes": total_taxes,
+                    "net_contribution": net_contribution
+                }
+            )
+            state.intermediates.trace_log.append(trace_entry)
+            trace_entries.append(trace_entry)
 
         # Update state intermediates
         state.intermediates.super_results["net_contribution"] = net_contribution
-        state.intermediates.trace_log.append(trace_entry)
 
         return CalculationResult(
             success=True,
             value=net_contribution,
-            trace_entries=[trace_entry]
+            trace_entries=trace_entries
         )
 
     except Exception as e:
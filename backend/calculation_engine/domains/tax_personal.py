@@ -6,23 +6,38 @@ This module contains calculations for personal income tax, including:
 - CAL-PIT-002: Medicare levy
 - CAL-PIT-004: Tax offsets (LITO)
 - CAL-PIT-005: Net tax payable/refund
+
+CAL-PIT-001 also computes the Medicare levy alongside PAYG tax, which
+CAL-PIT-002 then reports. It has a batch variant that taxes every
+entity's income in one compiled call; it writes the same intermediates and
+trace entries as the scalar function.
 """
 
 from decimal import Decimal
-from typing import Optional, Dict, Any, List
+from typing import Dict, Any, List, Sequence, Tuple
+import numpy as np
+from numba import float64, njit, prange
 from calculation_engine.schemas.calculation import CalculationState
 from calculation_engine.schemas.orchestration import TraceEntry
+from calculation_engine.schemas.calculation_result import CalculationResult
 from src.services.rule_loader import rule_loader
 
-# Import calculation result schema
-# TODO: This should be in shared/schemas once defined
-class CalculationResult:
-    """Result of a CAL execution."""
-    def __init__(self, success: bool, value: Optional[Decimal], trace_entries: list[TraceEntry], error_message: Optional[str] = None):
-        self.success = success
-        self.value = value
-        self.trace_entries = trace_entries
-        self.error_message = error_message
+# Below this many entities the threading overhead of the parallel batch
+# kernel outweighs the work, so the batch runs on one thread
+_PARALLEL_BATCH_MIN_ENTITIES = 16
+
+
+def _to_cents(amount: float) -> Decimal:
+    """Quantise a float amount to a Decimal in cents at the result boundary."""
+    return Decimal(f"{amount:.2f}")
+
+
+def _medicare_levy_parameters() -> Tuple[float, float]:
+    """Get the Medicare levy (rate, threshold) as floats from the rules."""
+    medicare_rate = float(rule_loader.get_medicare_levy_rate())
+    thresholds = rule_loader.get_medicare_levy_thresholds()
+    threshold = float(thresholds.get('single', 0))  # Simplified - using single threshold
+    return medicare_rate, threshold
 
 
 def run_CAL_PIT_001(
@@ -34,98 +49,175 @@ def run_CAL_PIT_001(
     Calculate PAYG tax for residents.
     CAL-PIT-001: Personal Income Tax on taxable income (resident)
     """
-    try:
-        # Get entity cashflow
-        if entity_id not in state.cashflow_context.flows:
-            return CalculationResult(
-                success=False,
-                value=None,
-                trace_entries=[],
-                error_message=f"Entity {entity_id} not found in cashflow context"
-            )
-
-        cashflow = state.cashflow_context.flows[entity_id]
-
-        # Calculate taxable income (simplified - assumes assessable income = salary/wages)
-        assessable_income = cashflow.salary_wages_gross or Decimal("0")
-        deductions = Decimal("0")  # Simplified - no deductions in MVP
-        taxable_income = assessable_income - deductions
-
-        # Load tax brackets from rules
-        tax_brackets = rule_loader.get_tax_brackets()
-
-        # Calculate tax using progressive brackets
-        tax_payable = _calculate_progressive_tax(taxable_income, tax_brackets)
-
-        # Create trace entry
+    # Get entity cashflow
+    cashflow = state.cashflow_context.flows.get(entity_id)
+    if cashflow is None:
+        return CalculationResult(
+            success=False,
+            value=None,
+            trace_entries=[],
+            error_message=f"Entity {entity_id} not found in cashflow context"
+        )
+
+    intermediates = state.intermediates
+
+    # Calculate taxable income (simplified - assumes assessable income = salary/wages)
+    # Arithmetic runs in float64; results are quantised to cents when stored
+    assessable_income = float(cashflow.salary_wages_gross)
+    deductions = 0.0  # Simplified - no deductions in MVP
+    taxable_income = assessable_income - deductions
+
+    # Load tax brackets from rules
+    lowers, widths, rates = rule_loader.get_tax_bracket_arrays()
+
+    # Calculate tax using progressive brackets
+    tax_payable = _to_cents(_calculate_progressive_tax(taxable_income, lowers, widths, rates))
+
+    # Medicare levy is fused here while the income is at hand; CAL-PIT-002 reports it
+    medicare_rate, medicare_threshold = _medicare_levy_parameters()
+    medicare_levy = _to_cents(max(0.0, taxable_income - medicare_threshold) * medicare_rate)
+
+    # Create trace entry
+    trace_entries = []
+    if state.trace_enabled:
         trace_entry = TraceEntry(
             calc_id="CAL-PIT-001",
             entity_id=entity_id,
             field="tax_payable",
-            explanation=f"PAYG tax calculated for resident on taxable income of {taxable_income}",
+            explanation=f"PAYG tax calculated for resident on taxable income of {taxable_income:.2f}",
             metadata={
                 "assessable_income": assessable_income,
                 "deductions": deductions,
                 "taxable_income": taxable_income,
-                "tax_brackets_applied": len(tax_brackets)
+                "tax_brackets_applied": len(rates)
             }
         )
+        intermediates.trace_log.append(trace_entry)
+        trace_entries.append(trace_entry)
 
-        # Update state intermediates
-        if entity_id not in state.intermediates.tax_results:
-            state.intermediates.tax_results[entity_id] = {}
+    # Update state intermediates
+    intermediates.tax_results.setdefault(entity_id, {}).update(
+        taxable_income=_to_cents(taxable_income),
+        payg_tax=tax_payable,
+        medicare_levy=medicare_levy
+    )
 
-        state.intermediates.tax_results[entity_id]["payg_tax"] = tax_payable
-        state.intermediates.trace_log.append(trace_entry)
+    return CalculationResult(
+        success=True,
+        value=tax_payable,
+        trace_entries=trace_entries
+    )
 
-        return CalculationResult(
-            success=True,
-            value=tax_payable,
-            trace_entries=[trace_entry]
-        )
 
-    except Exception as e:
-        return CalculationResult(
-            success=False,
-            value=None,
-            trace_entries=[],
-            error_message=f"Error in CAL-PIT-001: {str(e)}"
+def run_CAL_PIT_001_batch(
+    state: CalculationState,
+    entity_ids: Sequence[str],
+    taxable_incomes: np.ndarray
+) -> np.ndarray:
+    """
+    Calculate PAYG tax for a batch of resident entities.
+    CAL-PIT-001 (batch): one compiled pass over all entities for projections
+
+    Args:
+        state: Calculation state to record intermediates and trace entries on
+        entity_ids: Entity identifiers, aligned with taxable_incomes
+        taxable_incomes: Taxable income per entity (float64)
+
+    Returns:
+        Tax payable per entity (float64, unrounded)
+    """
+    incomes = np.ascontiguousarray(taxable_incomes, dtype=np.float64)
+    lowers, widths, rates = rule_loader.get_tax_bracket_arrays()
+
+    taxes = np.zeros_like(incomes)
+    if rates.size:
+        if incomes.shape[0] >= _PARALLEL_BATCH_MIN_ENTITIES:
+            _progressive_tax_batch_kernel(incomes, lowers, widths, rates, taxes)
+        else:
+            _progressive_tax_serial_kernel(incomes, lowers, widths, rates, taxes)
+
+    medicare_rate, medicare_threshold = _medicare_levy_parameters()
+    medicare_levies = np.maximum(incomes - medicare_threshold, 0.0) * medicare_rate
+
+    tax_results = state.intermediates.tax_results
+    trace_log = state.intermediates.trace_log
+    trace_enabled = state.trace_enabled
+    for entity_id, taxable_income, tax, medicare_levy in zip(
+        entity_ids, incomes.tolist(), taxes.tolist(), medicare_levies.tolist()
+    ):
+        tax_results.setdefault(entity_id, {}).update(
+            taxable_income=_to_cents(taxable_income),
+            payg_tax=_to_cents(tax),
+            medicare_levy=_to_cents(medicare_levy)
         )
+        if not trace_enabled:
+            continue
+        trace_log.append(TraceEntry(
+            calc_id="CAL-PIT-001",
+            entity_id=entity_id,
+            field="tax_payable",
+            explanation=f"PAYG tax calculated for resident on taxable income of {taxable_income:.2f}",
+            metadata={
+                "assessable_income": taxable_income,
+                "deductions": 0.0,
+                "taxable_income": taxable_income,
+                "tax_brackets_applied": len(rates)
+            }
+        ))
+
+    return taxes
 
 
-def _calculate_progressive_tax(taxable_income: Decimal, tax_brackets: list) -> Decimal:
+def _calculate_progressive_tax(
+    taxable_income: float,
+    lowers: np.ndarray,
+    widths: np.ndarray,
+    rates: np.ndarray
+) -> float:
     """
     Calculate progressive tax using marginal tax brackets.
 
     Args:
         taxable_income: The income to tax
-        tax_brackets: List of tax bracket dicts with 'min', 'max', 'rate' keys
+        lowers: Cumulative lower bound of each bracket (float64)
+        widths: Width of each bracket, inf for the top bracket (float64)
+        rates: Marginal rate of each bracket (float64)
 
     Returns:
         Total tax payable
     """
-    if not tax_brackets:
-        return Decimal("0")
+    if rates.size == 0:
+        return 0.0
 
-    total_tax = Decimal("0")
-    remaining_income = taxable_income
+    return _progressive_tax_kernel(taxable_income, lowers, widths, rates)
 
-    for bracket in sorted(tax_brackets, key=lambda x: x.get('min', 0)):
-        bracket_min = Decimal(str(bracket.get('min', 0)))
-        bracket_max = Decimal(str(bracket.get('max', float('inf')))) if bracket.get('max') else Decimal('inf')
-        rate = Decimal(str(bracket.get('rate', 0)))
 
-        if remaining_income <= 0:
+@njit(float64(float64, float64[:], float64[:], float64[:]), cache=True)
+def _progressive_tax_kernel(income, lowers, widths, rates):
+    """Compiled bracket loop: sum of min(max(income - lower, 0), width) * rate."""
+    total = 0.0
+    for i in range(lowers.size):
+        taxable_in_bracket = income - lowers[i]
+        if taxable_in_bracket <= 0.0:
             break
+        if taxable_in_bracket > widths[i]:
+            taxable_in_bracket = widths[i]
+        total += taxable_in_bracket * rates[i]
+    return total
 
-        # Calculate tax for this bracket
-        taxable_in_bracket = min(remaining_income, bracket_max - bracket_min)
-        tax_in_bracket = taxable_in_bracket * rate
 
-        total_tax += tax_in_bracket
-        remaining_income -= taxable_in_bracket
+@njit(parallel=True, cache=True)
+def _progressive_tax_batch_kernel(incomes, lowers, widths, rates, out):
+    """Compiled progressive tax over an array of incomes, across threads."""
+    for j in prange(incomes.shape[0]):
+        out[j] = _progressive_tax_kernel(incomes[j], lowers, widths, rates)
 
-    return total_tax
+
+@njit(cache=True)
+def _progressive_tax_serial_kernel(incomes, lowers, widths, rates, out):
+    """Compiled progressive tax over an array of incomes, on one thread."""
+    for j in range(incomes.shape[0]):
+        out[j] = _progressive_tax_kernel(incomes[j], lowers, widths, rates)
 
 
 def run_CAL_PIT_002(
@@ -134,38 +226,32 @@ def run_CAL_PIT_002(
     year_index: int = 0
 ) -> CalculationResult:
     """
-    Calculate Medicare levy.
-    CAL-PIT-002: Medicare levy on taxable income
+    Report Medicare levy.
+    CAL-PIT-002: Medicare levy on taxable income (computed by CAL-PIT-001)
     """
-    try:
-        # Get taxable income from previous calculations
-        if entity_id not in state.intermediates.tax_results or "taxable_income" not in state.intermediates.tax_results[entity_id]:
-            return CalculationResult(
-                success=False,
-                value=None,
-                trace_entries=[],
-                error_message=f"Taxable income not available for entity {entity_id}. Run CAL-PIT-001 first."
-            )
-
-        taxable_income = state.intermediates.tax_results[entity_id]["taxable_income"]
-
-        # Get Medicare levy rate and thresholds from rules
-        medicare_rate = rule_loader.get_medicare_levy_rate()
-        thresholds = rule_loader.get_medicare_levy_thresholds()
-
-        # Calculate Medicare levy with threshold
-        threshold = Decimal(str(thresholds.get('single', 0)))  # Simplified - using single threshold
-        medicare_levy = Decimal("0")
-
-        if taxable_income > threshold:
-            medicare_levy = (taxable_income - threshold) * medicare_rate
-
-        # Create trace entry
+    # Get the levy precomputed by CAL-PIT-001
+    intermediates = state.intermediates
+    tax_results = intermediates.tax_results.get(entity_id)
+    if tax_results is None or "medicare_levy" not in tax_results:
+        return CalculationResult(
+            success=False,
+            value=None,
+            trace_entries=[],
+            error_message=f"Taxable income not available for entity {entity_id}. Run CAL-PIT-001 first."
+        )
+
+    taxable_income = tax_results["taxable_income"]
+    medicare_levy = tax_results["medicare_levy"]
+
+    # Create trace entry
+    trace_entries = []
+    if state.trace_enabled:
+        medicare_rate, threshold = _medicare_levy_parameters()
         trace_entry = TraceEntry(
             calc_id="CAL-PIT-002",
             entity_id=entity_id,
             field="medicare_levy",
-            explanation=f"Medicare levy calculated at {medicare_rate} on income above threshold of {threshold}",
+            explanation=f"Medicare levy calculated at {medicare_rate} on income above threshold of {threshold:.2f}",
             metadata={
                 "taxable_income": taxable_income,
                 "threshold": threshold,
@@ -173,24 +259,14 @@ def run_CAL_PIT_002(
                 "levy_payable": medicare_levy
             }
         )
+        intermediates.trace_log.append(trace_entry)
+        trace_entries.append(trace_entry)
 
-        # Update state intermediates
-        state.intermediates.tax_results[entity_id]["medicare_levy"] = medicare_levy
-        state.intermediates.trace_log.append(trace_entry)
-
-        return CalculationResult(
-            success=True,
-            value=medicare_levy,
-            trace_entries=[trace_entry]
-        )
-
-    except Exception as e:
-        return CalculationResult(
-            success=False,
-            value=None,
-            trace_entries=[],
-            error_message=f"Error in CAL-PIT-002: {str(e)}"
-        )
+    return CalculationResult(
+        success=True,
+        value=medicare_levy,
+        trace_entries=trace_entries
+    )
 
 
 def run_CAL_PIT_004(
@@ -202,27 +278,30 @@ def run_CAL_PIT_004(
     Aggregate tax offsets.
     CAL-PIT-004: Tax offsets aggregation
     """
-    try:
-        # In MVP, we'll implement basic LITO (Low Income Tax Offset)
-        # More offsets can be added in extended calculations
+    # In MVP, we'll implement basic LITO (Low Income Tax Offset)
+    # More offsets can be added in extended calculations
 
-        if entity_id not in state.intermediates.tax_results or "taxable_income" not in state.intermediates.tax_results[entity_id]:
-            return CalculationResult(
-                success=False,
-                value=None,
-                trace_entries=[],
-                error_message=f"Taxable income not available for entity {entity_id}. Run CAL-PIT-001 first."
-            )
+    intermediates = state.intermediates
+    tax_results = intermediates.tax_results.get(entity_id)
+    if tax_results is None or "taxable_income" not in tax_results:
+        return CalculationResult(
+            success=False,
+            value=None,
+            trace_entries=[],
+            error_message=f"Taxable income not available for entity {entity_id}. Run CAL-PIT-001 first."
+        )
 
-        taxable_income = state.intermediates.tax_results[entity_id]["taxable_income"]
+    taxable_income = float(tax_results["taxable_income"])
 
-        # Calculate LITO (simplified)
-        lito_amount = _calculate_lito(taxable_income)
+    # Calculate LITO (simplified)
+    lito_amount = _to_cents(_calculate_lito(taxable_income))
 
-        # Total offsets (just LITO in MVP)
-        total_offsets = lito_amount
+    # Total offsets (just LITO in MVP)
+    total_offsets = lito_amount
 
-        # Create trace entry
+    # Create trace entry
+    trace_entries = []
+    if state.trace_enabled:
         trace_entry = TraceEntry(
             calc_id="CAL-PIT-004",
             entity_id=entity_id,
@@ -234,46 +313,40 @@ def run_CAL_PIT_004(
                 "taxable_income": taxable_income
             }
         )
+        intermediates.trace_log.append(trace_entry)
+        trace_entries.append(trace_entry)
 
-        # Update state intermediates
-        state.intermediates.tax_results[entity_id]["tax_offsets"] = total_offsets
-        state.intermediates.trace_log.append(trace_entry)
-
-        return CalculationResult(
-            success=True,
-            value=total_offsets,
-            trace_entries=[trace_entry]
-        )
+    # Update state intermediates
+    tax_results["tax_offsets"] = total_offsets
 
-    except Exception as e:
-        return CalculationResult(
-            success=False,
-            value=None,
-            trace_entries=[],
-            error_message=f"Error in CAL-PIT-004: {str(e)}"
-        )
+    return CalculationResult(
+        success=True,
+        value=total_offsets,
+        trace_entries=trace_entries
+    )
 
 
-def _calculate_lito(taxable_income: Decimal) -> Decimal:
+def _calculate_lito(taxable_income: float) -> float:
     """
     Calculate Low Income Tax Offset (LITO) using configured parameters.
     """
     lito_params = rule_loader.get_lito_parameters()
 
-    max_offset = lito_params["max_offset"]
-    income_limit = lito_params["income_limit"]
-    phase_out_start = lito_params["phase_out_start"]
-    phase_out_rate = lito_params["phase_out_rate"]
+    max_offset = float(lito_params["max_offset"])
+    income_limit = float(lito_params["income_limit"])
+    phase_out_start = float(lito_params["phase_out_start"])
+    phase_out_rate = float(lito_params["phase_out_rate"])
+    phase_out_limit = float(lito_params["phase_out_limit"])
 
     if taxable_income <= income_limit:
         return max_offset
-    elif taxable_income <= phase_out_start + ((max_offset / phase_out_rate)):
+    elif taxable_income <= phase_out_limit:
         # Phase out calculation
         excess = taxable_income - phase_out_start
         reduction = excess * phase_out_rate
-        return max(Decimal("0"), max_offset - reduction)
+        return max(0.0, max_offset - reduction)
     else:
-        return Decimal("0")
+        return 0.0
 
 
 def run_CAL_PIT_005(
@@ -285,31 +358,49 @@ def run_CAL_PIT_005(
     Calculate net tax payable/refund.
     CAL-PIT-005: Net tax payable / refund
     """
-    try:
-        tax_results = state.intermediates.tax_results.get(entity_id, {})
+    intermediates = state.intermediates
+    tax_results = intermediates.tax_results.get(entity_id)
+    if tax_results is None or "payg_tax" not in tax_results:
+        return CalculationResult(
+            success=False,
+            value=None,
+            trace_entries=[],
+            error_message=f"Tax payable not available for entity {entity_id}. Run CAL-PIT-001 first."
+        )
 
-        # Get required components
-        payg_tax = tax_results.get("payg_tax", Decimal("0"))
-        medicare_levy = tax_results.get("medicare_levy", Decimal("0"))
-        tax_offsets = tax_results.get("tax_offsets", Decimal("0"))
+    # Get required components
+    payg_tax = float(tax_results["payg_tax"])
+    medicare_levy = float(tax_results.get("medicare_levy", 0))
+    tax_offsets = float(tax_results.get("tax_offsets", 0))
 
-        # Get PAYG withheld from cashflow
-        cashflow = state.cashflow_context.flows.get(entity_id)
-        payg_withheld = cashflow.payg_withheld if cashflow else Decimal("0")
+    cashflow = state.cashflow_context.flows.get(entity_id)
+    if cashflow is None:
+        return CalculationResult(
+            success=False,
+            value=None,
+            trace_entries=[],
+            error_message=f"Entity {entity_id} not found in cashflow context"
+        )
+
+    # EntityCashflow does not record PAYG withheld yet; treat it as nil
+    # (the whole liability is payable on assessment) until it does
+    payg_withheld = float(getattr(cashflow, "payg_withheld", 0.0))
 
-        # Calculate gross tax
-        gross_tax = payg_tax + medicare_levy
+    # Calculate gross tax
+    gross_tax = payg_tax + medicare_levy
 
-        # Apply offsets
-        net_tax_before_withheld = gross_tax - tax_offsets
+    # Apply offsets
+    net_tax_before_withheld = gross_tax - tax_offsets
 
-        # Calculate final tax position
-        net_tax_payable = net_tax_before_withheld - payg_withheld
+    # Calculate final tax position
+    net_tax_payable = _to_cents(net_tax_before_withheld - payg_withheld)
 
-        # Determine if refund or payable
-        is_refund = net_tax_payable < 0
+    # Determine if refund or payable
+    is_refund = net_tax_payable < 0
 
-        # Create trace entry
+    # Create trace entry
+    trace_entries = []
+    if state.trace_enabled:
         trace_entry = TraceEntry(
             calc_id="CAL-PIT-005",
             entity_id=entity_id,
@@ -324,21 +415,14 @@ def run_CAL_PIT_005(
                 "is_refund": is_refund
             }
         )
+        intermediates.trace_log.append(trace_entry)
+        trace_entries.append(trace_entry)
 
-        # Update state intermediates
-        state.intermediates.tax_results[entity_id]["net_tax_payable"] = net_tax_payable
-        state.intermediates.trace_log.append(trace_entry)
-
-        return CalculationResult(
-            success=True,
-            value=net_tax_payable,
-            trace_entries=[trace_entry]
-        )
+    # Update state intermediates
+    tax_results["net_tax_payable"] = net_tax_payable
 
-    except Exception as e:
-        return CalculationResult(
-            success=False,
-            value=None,
-            trace_entries=[],
-            error_message=f"Error in CAL-PIT-005: {str(e)}"
-        )
+    return CalculationResult(
+        success=True,
+        value=net_tax_payable,
+        trace_entries=trace_entries
+    )
@@ -6,18 +6,57 @@ and projects it forward through time, applying growth rates, inflation,
 and recalculating financial metrics for each year.
 """
 
+from dataclasses import dataclass
 from decimal import Decimal
-from typing import List
+from typing import Iterator, List, Optional
+import numpy as np
 from calculation_engine.schemas.calculation import (
     CalculationState,
     ProjectionOutput,
+    ProjectionSummary,
     YearSnapshot,
     CalculatedIntermediariesContext
 )
+from calculation_engine.schemas.cashflow import CashflowContext, ProjectionCashflow
 from calculation_engine.schemas.orchestration import TraceEntry
+from src.services.rule_loader import rule_loader
+from .domains.tax_personal import run_CAL_PIT_001_batch
 from .registry import run_calculation
 
 
+@dataclass
+class CashflowColumns:
+    """
+    Growth-driven cashflow fields as float64 columns indexed by entity.
+
+    The projection fills in every year's values up front from cumulative
+    growth factors (salary_wages_gross_by_year, one row per year), moves
+    the current row into the columns each year, and writes them back to the
+    ProjectionCashflow working copies the CAL functions read, instead of
+    cloning the whole state per year.
+    """
+    entity_ids: List[str]
+    salary_wages_gross: np.ndarray
+    salary_wages_gross_by_year: Optional[np.ndarray] = None
+
+    @classmethod
+    def from_context(cls, cashflow_context: CashflowContext) -> "CashflowColumns":
+        """Build columns from the cashflows in a CashflowContext."""
+        entity_ids = list(cashflow_context.flows.keys())
+        return cls(
+            entity_ids=entity_ids,
+            salary_wages_gross=np.array(
+                [float(cashflow_context.flows[entity_id].salary_wages_gross) for entity_id in entity_ids],
+                dtype=np.float64
+            )
+        )
+
+    def write_to(self, cashflow_context: CashflowContext) -> None:
+        """Write the column values back to the working cashflows, in cents."""
+        for entity_id, salary in zip(self.entity_ids, self.salary_wages_gross.tolist()):
+            cashflow_context.flows[entity_id].salary_wages_gross = Decimal(f"{salary:.2f}")
+
+
 class ProjectionEngine:
     """Engine for projecting financial scenarios over multiple years."""
 
@@ -36,30 +75,107 @@ class ProjectionEngine:
         Returns:
             ProjectionOutput with complete timeline
         """
-        timeline: List[YearSnapshot] = []
+        timeline: List[YearSnapshot] = list(self.project_scenario_iter(base_state, projection_years))
 
-        # Start with base state as year 0
-        current_state = base_state.model_copy(deep=True)  # Deep copy to avoid mutations
+        return ProjectionOutput(
+            base_state=base_state,
+            timeline=timeline
+        )
 
-        for year_index in range(projection_years + 1):  # Include year 0
-            # Calculate financials for this year
-            year_snapshot = self._calculate_year_snapshot(current_state, year_index)
+    def project_scenario_iter(
+        self,
+        base_state: CalculationState,
+        projection_years: int = 30
+    ) -> Iterator[YearSnapshot]:
+        """
+        Project a financial scenario forward, yielding one year at a time.
 
-            # Add to timeline
-            timeline.append(year_snapshot)
+        Snapshots are not retained, so callers that reduce over the timeline
+        hold only the current year in memory. Rules stay pinned until the
+        iterator is exhausted or closed.
 
-            # Prepare for next year (if not the last year)
-            if year_index < projection_years:
-                current_state = self._advance_to_next_year(current_state, year_index)
+        Args:
+            base_state: The baseline calculation state (year 0)
+            projection_years: Number of years to project forward
 
-        return ProjectionOutput(
-            base_state=base_state,
-            timeline=timeline
+        Yields:
+            YearSnapshot for each year, starting with year 0
+        """
+        # Copy only the sub-trees the projection mutates (global context and
+        # cashflows); it is then advanced in place year by year. Entity and
+        # position contexts are read-only here and shared with base_state.
+        # Cashflows become unvalidated ProjectionCashflow working copies; the
+        # working state is never serialised.
+        current_state = base_state.model_copy(update={
+            "global_context": base_state.global_context.model_copy(),
+            "cashflow_context": base_state.cashflow_context.model_copy(update={
+                "flows": {
+                    entity_id: ProjectionCashflow.from_model(cashflow)
+                    for entity_id, cashflow in base_state.cashflow_context.flows.items()
+                }
+            }),
+        })
+        columns = CashflowColumns.from_context(current_state.cashflow_context)
+
+        # Growth rates are constant across the run, so every year's cashflows
+        # follow from the base year and one combined factor
+        global_context = current_state.global_context
+        combined_factor = (1 + float(global_context.inflation_rate)) * (1 + float(global_context.wage_growth_rate))
+        self._project_cashflow_growth(columns, combined_factor, projection_years)
+
+        # Rules are constant for the whole run; pin them once for every CAL call
+        with rule_loader.calculation_batch():
+            for year_index in range(projection_years + 1):  # Include year 0
+                # Calculate financials for this year
+                yield self._calculate_year_snapshot(current_state, columns, year_index)
+
+                # Prepare for next year (if not the last year)
+                if year_index < projection_years:
+                    self._advance_to_next_year(current_state, columns, year_index)
+
+    def summarise_scenario(
+        self,
+        base_state: CalculationState,
+        projection_years: int = 30
+    ) -> ProjectionSummary:
+        """
+        Project a scenario and reduce it to a ProjectionSummary.
+
+        Only running totals are kept, not per-year snapshots, for optimisation
+        loops that evaluate many scenarios. average_surplus and
+        retirement_adequacy_score are left as None as neither is modelled yet.
+
+        Args:
+            base_state: The baseline calculation state (year 0)
+            projection_years: Number of years to project forward
+
+        Returns:
+            ProjectionSummary for the scenario
+        """
+        total_tax_paid = Decimal("0")
+        net_wealth_end = base_state.position_context.net_worth
+
+        for year_snapshot in self.project_scenario_iter(base_state, projection_years):
+            for tax_results in year_snapshot.intermediaries.tax_results.values():
+                # Gross tax less offsets (PAYG withheld is a timing difference)
+                tax_paid = (
+                    tax_results.get("payg_tax", 0)
+                    + tax_results.get("medicare_levy", 0)
+                    - tax_results.get("tax_offsets", 0)
+                )
+                total_tax_paid += tax_paid
+            net_wealth_end = year_snapshot.position_snapshot.net_worth
+
+        return ProjectionSummary(
+            scenario_id=base_state.scenario_id,
+            net_wealth_end=net_wealth_end,
+            total_tax_paid=total_tax_paid,
         )
 
     def _calculate_year_snapshot(
         self,
         state: CalculationState,
+        columns: CashflowColumns,
         year_index: int
     ) -> YearSnapshot:
         """
@@ -67,20 +183,21 @@ class ProjectionEngine:
 
         Args:
             state: Calculation state for this year
+            columns: Cashflow columns for this year, aligned with state
             year_index: Which year this represents (0 = current year)
 
         Returns:
             YearSnapshot with calculated results
         """
         # Reset intermediates for this year's calculations
-        state.intermediates = CalculatedIntermediariesContext()
+        state.intermediates = CalculatedIntermediariesContext.with_trace_capacity(state.trace_log_capacity)
 
-        # Calculate tax metrics for each entity
-        for entity_id in state.cashflow_context.flows.keys():
-            self._calculate_entity_tax_metrics(state, entity_id, year_index)
+        # PAYG tax for all entities in one batch (taxable income = salary in MVP)
+        run_CAL_PIT_001_batch(state, columns.entity_ids, columns.salary_wages_gross)
 
-        # Calculate superannuation metrics for each entity
-        for entity_id in state.cashflow_context.flows.keys():
+        # Calculate remaining tax and superannuation metrics for each entity
+        for entity_id in columns.entity_ids:
+            self._calculate_entity_tax_metrics(state, entity_id, year_index)
             self._calculate_entity_super_metrics(state, entity_id, year_index)
 
         # Create year snapshot
@@ -97,9 +214,8 @@ class ProjectionEngine:
         entity_id: str,
         year_index: int
     ):
-        """Calculate tax-related metrics for an entity in a specific year."""
+        """Calculate tax-related metrics for an entity in a specific year (after batched CAL-PIT-001)."""
         # Run core tax calculations
-        run_calculation("CAL-PIT-001", state, entity_id, year_index)  # PAYG tax
         run_calculation("CAL-PIT-002", state, entity_id, year_index)  # Medicare levy
         run_calculation("CAL-PIT-004", state, entity_id, year_index)  # Tax offsets
         run_calculation("CAL-PIT-005", state, entity_id, year_index)  # Net tax payable
@@ -120,74 +236,85 @@ class ProjectionEngine:
 
     def _advance_to_next_year(
         self,
-        current_state: CalculationState,
+        state: CalculationState,
+        columns: CashflowColumns,
         year_index: int
-    ) -> CalculationState:
+    ) -> None:
         """
-        Advance the calculation state to the next year.
+        Advance the calculation state to the next year, in place.
 
-        This applies growth rates, inflation, and updates cashflows accordingly.
+        This moves the cashflow columns to the next year's precomputed
+        values and writes them back to the state's cashflows.
         """
-        next_state = current_state.model_copy(deep=True)
+        from_year = state.global_context.financial_year
 
         # Update global context for next year
-        next_state.global_context.financial_year += 1
+        state.global_context.financial_year += 1
 
-        # Apply inflation to cashflows
-        inflation_rate = current_state.global_context.inflation_rate
-        self._apply_inflation_to_cashflows(next_state, inflation_rate)
-
-        # Apply wage growth
-        wage_growth_rate = current_state.global_context.wage_growth_rate
-        self._apply_wage_growth_to_cashflows(next_state, wage_growth_rate)
+        # Apply inflation and wage growth to cashflows
+        inflation_rate = state.global_context.inflation_rate
+        wage_growth_rate = state.global_context.wage_growth_rate
+        if self._apply_growth_to_cashflows(columns, year_index + 1):
+            columns.write_to(state.cashflow_context)
 
         # Apply property growth to assets
-        property_growth_rate = current_state.global_context.property_growth_rate
-        self._apply_property_growth_to_assets(next_state, property_growth_rate)
+        property_growth_rate = state.global_context.property_growth_rate
+        self._apply_property_growth_to_assets(state, property_growth_rate)
 
         # Apply investment returns
-        equity_return_rate = current_state.global_context.equity_return_rate
-        fixed_income_return_rate = current_state.global_context.fixed_income_return_rate
-        self._apply_investment_returns_to_assets(next_state, equity_return_rate, fixed_income_return_rate)
-
-        # Add trace entry for year advancement
-        trace_entry = TraceEntry(
-            calc_id="PROJECTION_ADVANCE",
-            entity_id=None,  # Applies to all entities
-            field="year_advancement",
-            explanation=f"Advanced to year {year_index + 1} with growth rates applied",
-            metadata={
-                "from_year": current_state.global_context.financial_year,
-                "to_year": next_state.global_context.financial_year,
-                "inflation_rate": inflation_rate,
-                "wage_growth_rate": wage_growth_rate,
-                "property_growth_rate": property_growth_rate,
-                "equity_return_rate": equity_return_rate
-            }
-        )
-        next_state.intermediates.trace_log.append(trace_entry)
-
-        return next_state
+        equity_return_rate = state.global_context.equity_return_rate
+        fixed_income_return_rate = state.global_context.fixed_income_return_rate
+        self._apply_investment_returns_to_assets(state, equity_return_rate, fixed_income_return_rate)
+
+        # Add trace entry for year advancement (recorded in the year just completed)
+        if state.trace_enabled:
+            trace_entry = TraceEntry(
+                calc_id="PROJECTION_ADVANCE",
+                entity_id=None,  # Applies to all entities
+                field="year_advancement",
+                explanation=f"Advanced to year {year_index + 1} with growth rates applied",
+                metadata={
+                    "from_year": from_year,
+                    "to_year": state.global_context.financial_year,
+                    "inflation_rate": inflation_rate,
+                    "wage_growth_rate": wage_growth_rate,
+                    "property_growth_rate": property_growth_rate,
+                    "equity_return_rate": equity_return_rate
+                }
+            )
+            state.intermediates.trace_log.append(trace_entry)
+
+    def _project_cashflow_growth(
+        self,
+        columns: CashflowColumns,
+        combined_factor: float,
+        projection_years: int
+    ) -> None:
+        """
+        Precompute salary income for every projection year.
 
-    def _apply_inflation_to_cashflows(self, state: CalculationState, inflation_rate: Decimal):
-        """Apply inflation to cashflow amounts."""
-        if inflation_rate == 0:
+        Each year is base salary times the cumulative combined inflation and
+        wage growth factor, rounded to cents. A no-op factor leaves
+        salary_wages_gross_by_year unset.
+        """
+        if combined_factor == 1.0:
             return
 
-        for entity_id, cashflow in state.cashflow_context.flows.items():
-            # Inflate income and expenses (simplified)
-            if hasattr(cashflow, 'salary_wages_gross'):
-                cashflow.salary_wages_gross = (cashflow.salary_wages_gross * (1 + inflation_rate)).quantize(Decimal('0.01'))
+        cum_factors = np.cumprod(np.concatenate(([1.0], np.full(projection_years, combined_factor))))
+        columns.salary_wages_gross_by_year = np.round(np.outer(cum_factors, columns.salary_wages_gross), 2)
 
-    def _apply_wage_growth_to_cashflows(self, state: CalculationState, wage_growth_rate: Decimal):
-        """Apply wage growth to salary income."""
-        if wage_growth_rate == 0:
-            return
+    def _apply_growth_to_cashflows(self, columns: CashflowColumns, year_index: int) -> bool:
+        """
+        Move the cashflow columns to the precomputed values for a year.
+
+        Returns:
+            False when there is no growth and the columns were left untouched
+        """
+        if columns.salary_wages_gross_by_year is None:
+            return False
 
-        for entity_id, cashflow in state.cashflow_context.flows.items():
-            # Apply wage growth on top of inflation
-            if hasattr(cashflow, 'salary_wages_gross'):
-                cashflow.salary_wages_gross = (cashflow.salary_wages_gross * (1 + wage_growth_rate)).quantize(Decimal('0.01'))
+        columns.salary_wages_gross = columns.salary_wages_gross_by_year[year_index]
+        return True
 
     def _apply_property_growth_to_assets(self, state: CalculationState, property_growth_rate: Decimal):
         """Apply property growth to property assets."""
@@ -221,3 +348,17 @@ def run_projection(base_state: CalculationState, projection_years: int = 30) ->
         Complete projection output
     """
     return projection_engine.project_scenario(base_state, projection_years)
+
+
+def run_projection_summary(base_state: CalculationState, projection_years: int = 30) -> ProjectionSummary:
+    """
+    Convenience function to run a projection and return only its summary.
+
+    Args:
+        base_state: The baseline calculation state
+        projection_years: Number of years to project
+
+    Returns:
+        Projection summary
+    """
+    return projection_engine.summarise_scenario(base_state, projection_years)
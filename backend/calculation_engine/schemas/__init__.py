@@ -5,50 +5,66 @@ This package provides Pydantic models for the entire four-engine system,
 organized by domain: calculation, entities, assets, cashflow, and orchestration.
 """
 
-# Import base models first
-from .entities import (
-    EntityContext,
-    Person,
-    Relationship,
-    HouseholdBudget,
-    CompanyEntity,
-    TrustEntity,
-    SMSFEntity,
-)
-
-from .assets import (
-    FinancialPositionContext,
-    Asset,
-    PropertyAsset,
-    SuperAccount,
-    Loan,
-    InsurancePolicy,
-    ValuationSnapshot,
-    Ownership,
-)
-
-from .cashflow import (
-    CashflowContext,
-    EntityCashflow,
-)
-
-from .orchestration import (
-    TraceEntry,
-    TraceLog,
-    Strategy,
-    AdviceOutcome,
-)
-
-# Import calculation models (depends on others)
-from .calculation import (
-    GlobalContext,
-    AssumptionSet,
-    CalculatedIntermediariesContext,
-    CalculationState,
-    YearSnapshot,
-    ProjectionOutput,
-    ProjectionSummary,
-)
+from importlib import import_module
+from typing import Any, Dict
+
+# Submodules are imported on first attribute access (PEP 562) so that a
+# worker which only needs, say, EntityCashflow does not load every schema.
+_LAZY_MAP: Dict[str, str] = {
+    # Entities
+    "EntityContext": ".entities",
+    "Person": ".entities",
+    "Relationship": ".entities",
+    "HouseholdBudget": ".entities",
+    "CompanyEntity": ".entities",
+    "TrustEntity": ".entities",
+    "SMSFEntity": ".entities",
+
+    # Assets & Liabilities
+    "FinancialPositionContext": ".assets",
+    "Asset": ".assets",
+    "PropertyAsset": ".assets",
+    "SuperAccount": ".assets",
+    "Loan": ".assets",
+    "InsurancePolicy": ".assets",
+    "ValuationSnapshot": ".assets",
+    "Ownership": ".assets",
+
+    # Cashflow
+    "CashflowContext": ".cashflow",
+    "EntityCashflow": ".cashflow",
+
+    # Orchestration
+    "TraceEntry": ".orchestration",
+    "TraceLog": ".orchestration",
+    "Strategy": ".orchestration",
+    "AdviceOutcome": ".orchestration",
+
+    # Calculation
+    "GlobalContext": ".calculation",
+    "AssumptionSet": ".calculation",
+    "CgtResults": ".calculation",
+    "PropertyResults": ".calculation",
+    "CalculatedIntermediariesContext": ".calculation",
+    "CalculationState": ".calculation",
+    "YearSnapshot": ".calculation",
+    "ProjectionOutput": ".calculation",
+    "ProjectionSummary": ".calculation",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_MAP.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value  # Cache so later lookups bypass __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_MAP))
+
 
 # Export all models
 __all__ = [
@@ -84,6 +100,8 @@ __all__ = [
     # Calculation
     "GlobalContext",
     "AssumptionSet",
+    "CgtResults",
+    "PropertyResults",
     "CalculatedIntermediariesContext",
     "CalculationState",
     "YearSnapshot",
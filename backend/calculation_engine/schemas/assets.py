@@ -8,7 +8,7 @@ and the FinancialPositionContext that aggregates them.
 from datetime import date
 from decimal import Decimal
 from typing import Dict, List, Optional, Literal
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 # TODO: Import proper enum types from external model files
 AssetType = Literal["HOME", "INVESTMENT_RESIDENTIAL", "COMMERCIAL", "SUPER_INDUSTRY", "SUPER_RETAIL", "SUPER_SMSF", "CASH", "SHARES", "BONDS", "OTHER"]
@@ -16,6 +16,8 @@ AssetType = Literal["HOME", "INVESTMENT_RESIDENTIAL", "COMMERCIAL", "SUPER_INDUS
 
 class ValuationSnapshot(BaseModel):
     """Point-in-time asset or liability valuation."""
+    model_config = ConfigDict(frozen=True)  # Immutable leaf value; hashable and safe to share
+
     amount: Decimal
     currency: str = "AUD"
     effective_date: date
@@ -24,6 +26,8 @@ class ValuationSnapshot(BaseModel):
 
 class Ownership(BaseModel):
     """Ownership share in an asset or liability."""
+    model_config = ConfigDict(frozen=True)  # Immutable leaf value; hashable and safe to share
+
     entity_id: str
     share: Decimal = Field(..., ge=0, le=1)
 
@@ -5,10 +5,11 @@ This module defines CalculationState and ProjectionOutput models that serve
 as the primary inputs and outputs for all CAL-* calculations.
 """
 
+from collections import deque
 from datetime import date
 from decimal import Decimal
-from typing import Dict, List, Optional, Any, Literal
-from pydantic import BaseModel, Field
+from typing import Annotated, Deque, Dict, List, Optional, Any, Literal
+from pydantic import BaseModel, Field, PlainSerializer, PrivateAttr
 
 # Forward declarations for type hints - imported at runtime to avoid circular imports
 from typing import TYPE_CHECKING
@@ -68,13 +69,36 @@ class AssumptionSet(BaseModel):
     market_crash_flag: bool = False
 
 
+class CgtResults(BaseModel):
+    """Fixed-slot capital gains outputs written by CAL-CGT-*."""
+    capital_gain: Decimal = Decimal("0")
+    discounted_gain: Decimal = Decimal("0")
+
+
+class PropertyResults(BaseModel):
+    """Fixed-slot property outputs written by CAL-PFL-*."""
+    negative_gearing_benefit: Decimal = Decimal("0")
+
+
 class CalculatedIntermediariesContext(BaseModel):
     """Namespaced calculation results passed between CALs."""
     tax_results: Dict[str, Any] = Field(default_factory=dict)  # TODO: Import TaxResults
     super_results: Dict[str, Any] = Field(default_factory=dict)  # TODO: Import SuperResults
-    property_results: Dict[str, Any] = Field(default_factory=dict)  # TODO: Import PropertyResults
+    cgt_results: CgtResults = Field(default_factory=CgtResults)
+    property_results: PropertyResults = Field(default_factory=PropertyResults)
     plan_level_results: Dict[str, Any] = Field(default_factory=dict)  # TODO: Import PlanLevelResults
-    trace_log: List[Dict[str, Any]] = Field(default_factory=list)  # TODO: Import TraceEntry
+    # Serialised as a list: pydantic walks a deque item by item in Python, a
+    # list in one pydantic-core pass
+    trace_log: Annotated[
+        Deque[Dict[str, Any]],
+        PlainSerializer(list, return_type=List[Dict[str, Any]]),
+    ] = Field(default_factory=deque)  # TODO: Import TraceEntry
+    _info_trace_count: int = PrivateAttr(default=0)
+
+    @classmethod
+    def with_trace_capacity(cls, capacity: Optional[int] = None) -> "CalculatedIntermediariesContext":
+        """Create an empty context whose trace_log is a ring buffer of at most `capacity` entries."""
+        return cls(trace_log=deque(maxlen=capacity))
 
 
 class CalculationState(BaseModel):
@@ -88,6 +112,9 @@ class CalculationState(BaseModel):
 
     # Working state (populated by CALs)
     intermediates: CalculatedIntermediariesContext = Field(default_factory=CalculatedIntermediariesContext)
+    trace_enabled: bool = Field(default=True, description="Emit TraceEntry records; disable for bulk/Monte Carlo runs")
+    trace_log_capacity: Optional[int] = Field(default=None, ge=1, description="Keep only the most recent N trace entries per year (None = unbounded)")
+    trace_info_sampling: int = Field(default=1, ge=1, description="Keep 1 in N info traces added via add_trace; warnings and decision points are always kept")
 
     # Metadata
     scenario_id: str
@@ -108,6 +135,15 @@ class ProjectionOutput(BaseModel):
     base_state: CalculationState
     timeline: List[YearSnapshot] = Field(default_factory=list)
 
+    def to_json_bytes(self) -> bytes:
+        """
+        Serialise to UTF-8 JSON bytes in one pydantic-core pass.
+
+        Equivalent to model_dump_json().encode() without building the
+        intermediate str; use when caching or returning a full timeline.
+        """
+        return self.__pydantic_serializer__.to_json(self)
+
 
 class ProjectionSummary(BaseModel):
     """Light-weight projection summary for Strategy Engine optimization loops.
@@ -117,6 +153,20 @@ class ProjectionSummary(BaseModel):
     scenario_id: str
     net_wealth_end: Decimal
     total_tax_paid: Decimal
-    average_surplus: Decimal
-    retirement_adequacy_score: float
+    # Not modelled yet: cashflows carry no living expenses and there is no
+    # retirement adequacy calculation, so these stay None until they are
+    average_surplus: Optional[Decimal] = None
+    retirement_adequacy_score: Optional[float] = None
     # Add other KPI fields as needed for optimization constraints
+
+
+# Resolve the forward references above once, at import time, so the first
+# CalculationState validation neither rebuilds the schema nor fails on
+# undefined names. These modules do not import this one, so there is no cycle.
+from .entities import EntityContext  # noqa: E402
+from .assets import FinancialPositionContext  # noqa: E402
+from .cashflow import CashflowContext  # noqa: E402
+
+CalculationState.model_rebuild()
+YearSnapshot.model_rebuild()
+ProjectionOutput.model_rebuild()
@@ -0,0 +1,41 @@
+"""
+Calculation result schema for Four-Engine Architecture.
+
+This module defines the CalculationResult returned by every CAL-* function.
+It is a plain slotted class rather than a Pydantic model because one is
+allocated per CAL call across every projection year.
+"""
+
+from decimal import Decimal
+from typing import Optional, Sequence
+
+from .orchestration import TraceEntry
+
+
+class CalculationResult:
+    """Result of a CAL execution."""
+
+    __slots__ = ("success", "value", "trace_entries", "error_message")
+
+    success: bool
+    value: Optional[Decimal]
+    trace_entries: Sequence[TraceEntry]
+    error_message: Optional[str]
+
+    def __init__(
+        self,
+        success: bool,
+        value: Optional[Decimal],
+        trace_entries: Sequence[TraceEntry],
+        error_message: Optional[str] = None
+    ):
+        self.success = success
+        self.value = value
+        self.trace_entries = trace_entries
+        self.error_message = error_message
+
+    def __repr__(self) -> str:
+        return (
+            f"CalculationResult(success={self.success!r}, value={self.value!r}, "
+            f"trace_entries={len(self.trace_entries)}, error_message={self.error_message!r})"
+        )
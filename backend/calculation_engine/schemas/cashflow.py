@@ -5,6 +5,7 @@ This module defines EntityCashflow and CashflowContext models for
 income, expenses, and cashflow calculations.
 """
 
+from dataclasses import dataclass
 from decimal import Decimal
 from typing import Dict, Optional
 from pydantic import BaseModel, Field
@@ -45,6 +46,52 @@ class EntityCashflow(BaseModel):
     downsizer_contributions: Decimal = Field(default=0)
 
 
+@dataclass
+class ProjectionCashflow:
+    """
+    Working copy of an EntityCashflow used inside the projection loop.
+
+    EntityCashflow validates at ingest; this slotted dataclass mirrors its
+    fields so per-year reads and writes are plain slot accesses. It is
+    never serialised.
+    """
+    __slots__ = tuple(EntityCashflow.model_fields)
+
+    entity_id: str
+
+    # Employment income
+    salary_wages_gross: Decimal
+    salary_sacrifice_super: Decimal
+    bonus_gross: Decimal
+    allowances_gross: Decimal
+    reportable_fringe_benefits: Decimal
+
+    # Investment income
+    interest_income: Decimal
+    dividend_unfranked: Decimal
+    dividend_franked: Decimal
+    dividend_franking_credits: Decimal
+    rental_income_gross: Decimal
+    foreign_income: Decimal
+    foreign_tax_paid: Decimal
+
+    # Deductions
+    work_related_expenses: Decimal
+    personal_super_contributions: Decimal
+    interest_deductions: Decimal
+
+    # Super contributions
+    employer_super_guarantee: Decimal
+    personal_non_concessional_contributions: Decimal
+    spouse_contributions_received: Decimal
+    downsizer_contributions: Decimal
+
+    @classmethod
+    def from_model(cls, model: EntityCashflow) -> "ProjectionCashflow":
+        """Copy a validated EntityCashflow into a working cashflow."""
+        return cls(**model.__dict__)
+
+
 class CashflowContext(BaseModel):
     """Complete cashflow context."""
     flows: Dict[str, EntityCashflow] = Field(default_factory=dict)  # Keyed by entity_id
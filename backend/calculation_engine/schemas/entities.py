@@ -6,10 +6,10 @@ and context classes that aggregate entities for calculations.
 """
 
 from datetime import date
-from math import floor
 from decimal import Decimal
-from typing import Dict, List, Optional, Literal
-from pydantic import BaseModel, Field
+from itertools import chain
+from typing import Dict, Iterator, List, Optional, Literal, Tuple, Union
+from pydantic import BaseModel, ConfigDict, Field
 
 # TODO: Import proper enum types from external model files
 PersonRole = Literal["PRIMARY", "PARTNER", "DEPENDANT"]
@@ -21,6 +21,8 @@ RelationshipType = Literal["SPOUSE", "CHILD", "PARENT", "SIBLING", "OTHER"]
 
 class Relationship(BaseModel):
     """Relationship between persons."""
+    model_config = ConfigDict(frozen=True)  # Immutable leaf value; hashable and safe to share
+
     target_person_id: str
     type: RelationshipType  # spouse, child, parent
     financial_dependence: Decimal = Field(0.0, ge=0.0, le=1.0)
@@ -51,7 +53,9 @@ class Person(BaseModel):
 
     # Derived fields (calculated runtime helpers)
     def age_at(self, at_date: date) -> int:
-        return floor((at_date - self.date_of_birth).days / 365.25)
+        # Completed years: subtract one if the birthday has not yet occurred in at_date's year
+        dob = self.date_of_birth
+        return at_date.year - dob.year - ((at_date.month, at_date.day) < (dob.month, dob.day))
 
 
 class HouseholdBudget(BaseModel):
@@ -112,3 +116,12 @@ class EntityContext(BaseModel):
     companies: Dict[str, CompanyEntity] = Field(default_factory=dict)  # Keyed by company_id
     trusts: Dict[str, TrustEntity] = Field(default_factory=dict)  # Keyed by trust_id
     smsfs: Dict[str, SMSFEntity] = Field(default_factory=dict)  # Keyed by smsf_id
+
+    def iter_entities(self) -> Iterator[Tuple[str, Union[Person, CompanyEntity, TrustEntity, SMSFEntity]]]:
+        """Iterate (entity_id, entity) over persons, companies, trusts and SMSFs in one pass."""
+        return chain(
+            self.persons.items(),
+            self.companies.items(),
+            self.trusts.items(),
+            self.smsfs.items()
+        )
@@ -5,10 +5,11 @@ This module defines TraceLog, Strategy, AdviceOutcome models and
 other orchestration-related schemas for engine coordination.
 """
 
+import sys
 from datetime import datetime
 from decimal import Decimal
 from typing import Dict, List, Optional, Any, Literal
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
 
 class TraceEntry(BaseModel):
@@ -20,6 +21,12 @@ class TraceEntry(BaseModel):
     metadata: Dict[str, Any]
     reference_document_id: Optional[str] = None  # Foreign key to regulatory sources
 
+    @field_validator("calc_id", "entity_id", "field")
+    @classmethod
+    def _intern_identifier(cls, value: Optional[str]) -> Optional[str]:
+        """Intern repeated identifiers so traces reloaded from JSON share one string per value."""
+        return sys.intern(value) if value is not None else None
+
 
 class TraceLog(BaseModel):
     """Complete audit trail for a calculation session."""
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import sys
+from dataclasses import dataclass, field as dataclass_field
 from datetime import date
-from typing import Any, Dict, List, Optional, Literal
+from typing import Annotated, Any, Dict, List, Optional, Literal, Union
 
-from pydantic import BaseModel, Field
+import numpy as np
+from pydantic import BaseModel, Field, PlainSerializer, PlainValidator, PrivateAttr, WithJsonSchema, field_validator, model_validator
 
 
 # ---------------------------------------------------------------------------
@@ -16,11 +19,14 @@ WorkStatus = Literal["full_time", "part_time", "self_employed", "not_working", "
 SmokerStatus = Literal["smoker", "non_smoker"]
 RelationshipType = Literal["spouse", "child", "parent"]
 
-AssetType = Literal[
+PropertyAssetType = Literal[
     "home",
     "investment_residential",
     "commercial",
     "land",
+]
+
+GeneralAssetType = Literal[
     "super_accumulation",
     "super_pension",
     "portfolio",
@@ -30,6 +36,8 @@ AssetType = Literal[
     "smsf_member_balance",  # Member interest in SMSF, linked to SMSFEntity
 ]
 
+AssetType = Literal[PropertyAssetType, GeneralAssetType]
+
 LoanType = Literal[
     "home_loan",
     "investment_loan",
@@ -56,20 +64,87 @@ ExpenseAllocationStrategy = Literal[
 TraceSeverity = Literal["info", "warning", "decision_point"]
 
 
+def _year_index(key: Any) -> int:
+    try:
+        year_index = int(key)
+    except (TypeError, ValueError):
+        raise ValueError(f"year index must be an integer, got {key!r}") from None
+    if year_index < 0 or (not isinstance(key, str) and year_index != key):
+        raise ValueError(f"year index must be a non-negative integer, got {key!r}")
+    return year_index
+
+
+def _to_year_series(value: Any) -> np.ndarray:
+    """
+    Coerce a list/array, or a legacy {year_index: amount} dict, to a dense float64 array.
+
+    Raises ValueError (reported as a ValidationError) for non-numeric values
+    or negative / non-integer year indexes.
+    """
+    try:
+        if isinstance(value, dict):
+            amounts = {_year_index(year_index): amount for year_index, amount in value.items()}
+            series = np.zeros(max(amounts, default=-1) + 1, dtype=np.float64)
+            for year_index, amount in amounts.items():
+                series[year_index] = amount
+            return series
+        return np.asarray(value, dtype=np.float64).reshape(-1)
+    except TypeError as exc:
+        raise ValueError(f"expected a sequence of numbers or a {{year_index: amount}} mapping: {exc}") from None
+
+
+# Dense per-year series (index = projection year_index), held as a float64 array
+# and serialised as a JSON list of numbers
+YearSeries = Annotated[
+    np.ndarray,
+    PlainValidator(_to_year_series),
+    PlainSerializer(lambda series: series.tolist(), return_type=List[float]),
+    WithJsonSchema({"type": "array", "items": {"type": "number"}}),
+]
+
+
+def _empty_year_series() -> np.ndarray:
+    return np.zeros(0, dtype=np.float64)
+
+
+class _YearSeriesModel(BaseModel):
+    """
+    Base for models with YearSeries fields.
+
+    BaseModel.__eq__ compares field values with ==, which is ambiguous for
+    ndarrays; compare array fields by value with np.array_equal instead.
+    """
+
+    def __eq__(self, other: Any) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(
+            np.array_equal(value, other.__dict__[name])
+            if isinstance(value, np.ndarray)
+            else value == other.__dict__[name]
+            for name, value in self.__dict__.items()
+        )
+
+
 # ---------------------------------------------------------------------------
 # Core primitives: people & relationships
 # ---------------------------------------------------------------------------
 
 
-class Relationship(BaseModel):
+# Small leaf value types below are plain dataclasses: Pydantic validates them
+# when the enclosing CalculationState is validated at the API boundary, and
+# internal construction skips validation entirely.
+
+
+@dataclass
+class Relationship:
     target_person_id: str
     type: RelationshipType
-    financial_dependence: float = Field(
-        0.0,
+    financial_dependence: Annotated[float, Field(
         ge=0.0,
         le=1.0,
         description="0–1 weighting for financial dependency / tax dependant status.",
-    )
+    )] = 0.0
 
 
 class Person(BaseModel):
@@ -84,19 +159,38 @@ class Person(BaseModel):
     relationships: List[Relationship] = Field(default_factory=list)
 
 
-class ValuationSnapshot(BaseModel):
+# The snapshots keep currency second, as the original models declared it, so
+# __init__ is written out: a generated one cannot take a defaulted field
+# before required ones on Python 3.9.
+
+
+@dataclass(init=False)
+class ValuationSnapshot:
     amount: float
     currency: CurrencyCode = "AUD"
     effective_date: date
     source: ValuationSource
 
+    def __init__(self, amount: float, currency: CurrencyCode = "AUD", *, effective_date: date, source: ValuationSource):
+        self.amount = amount
+        self.currency = currency
+        self.effective_date = effective_date
+        self.source = source
+
 
-class BalanceSnapshot(BaseModel):
+@dataclass(init=False)
+class BalanceSnapshot:
     amount: float
     currency: CurrencyCode = "AUD"
     effective_date: date
     source: BalanceSource
 
+    def __init__(self, amount: float, currency: CurrencyCode = "AUD", *, effective_date: date, source: BalanceSource):
+        self.amount = amount
+        self.currency = currency
+        self.effective_date = effective_date
+        self.source = source
+
 
 # ---------------------------------------------------------------------------
 # Legal entities
@@ -136,9 +230,10 @@ class SMSFEntity(BaseModel):
 # ---------------------------------------------------------------------------
 
 
-class Ownership(BaseModel):
+@dataclass
+class Ownership:
     entity_id: str
-    share: float = Field(..., ge=0.0, le=1.0)  # sum across owners ≈ 1.0
+    share: Annotated[float, Field(ge=0.0, le=1.0)]  # sum across owners ≈ 1.0
 
 
 class Asset(BaseModel):
@@ -165,8 +260,13 @@ class Asset(BaseModel):
         description="If this asset is an interest in an entity (e.g. SMSF), link to that entity_id.",
     )
 
-    class Config:
-        extra = "allow"  # allow extensions in subclasses without breaking the model
+
+class GeneralAsset(Asset):
+    """
+    Assets with no type-specific fields yet (super, portfolio, cash, etc.).
+    """
+
+    asset_type: GeneralAssetType
 
 
 class PropertyAsset(Asset):
@@ -174,6 +274,7 @@ class PropertyAsset(Asset):
     Specialisation for direct property (home/investment).
     """
 
+    asset_type: PropertyAssetType
     state_territory: str
     acquisition_date: date
     cost_base: float
@@ -205,9 +306,12 @@ class PropertyAsset(Asset):
     def value_at(self, target_date: date, default_growth_rate: float) -> float:
         """
         Deterministic projection from valuation.effective_date to target_date.
-        Implement in engine layer.
+        Uncached; use calculation_engine.valuation.ValuationCache within a projection run.
         """
-        raise NotImplementedError
+        # Imported here: the engine-layer valuation module imports this one
+        from calculation_engine.valuation import property_value_at
+
+        return property_value_at(self, target_date, default_growth_rate)
 
 
 class Loan(BaseModel):
@@ -242,12 +346,16 @@ class Loan(BaseModel):
 
     stress_buffer_rate: float = 0.0  # for serviceability/stress tests
 
-    def balance_at(self, target_date: date, assumptions: "EconomicAssumptions") -> float:
+    def balance_at(self, as_at: date, target_date: date) -> float:
         """
-        Deterministic projection of loan balance at a target date.
-        Implement amortisation in engine layer.
+        Deterministic projection of loan balance at a target date, from
+        principal_outstanding stated at as_at.
+        Uncached; use calculation_engine.valuation.ValuationCache within a projection run.
         """
-        raise NotImplementedError
+        # Imported here: the engine-layer valuation module imports this one
+        from calculation_engine.valuation import loan_balance_at
+
+        return loan_balance_at(self, as_at, target_date)
 
 
 # ---------------------------------------------------------------------------
@@ -298,6 +406,14 @@ class HouseholdBudget(BaseModel):
 # ---------------------------------------------------------------------------
 
 
+# Canonical trust distribution component keys, in the column order used by
+# IncomeFlows.distribution_components_array()
+DISTRIBUTION_COMPONENT_KEYS = tuple(
+    sys.intern(key) for key in ("franked", "unfranked", "capital_gain", "foreign_income", "other")
+)
+_DISTRIBUTION_COMPONENT_INDEX = {key: i for i, key in enumerate(DISTRIBUTION_COMPONENT_KEYS)}
+
+
 class IncomeFlows(BaseModel):
     # Employment
     salary_gross: float = 0.0
@@ -323,6 +439,23 @@ class IncomeFlows(BaseModel):
     # Trust distributions (simple)
     trust_distribution_components: Dict[str, float] = Field(default_factory=dict)
 
+    @field_validator("trust_distribution_components")
+    @classmethod
+    def _intern_component_keys(cls, components: Dict[str, float]) -> Dict[str, float]:
+        # Keys repeat across every entity; share one string object per key
+        return {sys.intern(key): amount for key, amount in components.items()}
+
+    def distribution_components_array(self) -> np.ndarray:
+        """
+        Trust distribution components as a float64 vector ordered by
+        DISTRIBUTION_COMPONENT_KEYS; unrecognised keys are summed into "other".
+        """
+        components = np.zeros(len(DISTRIBUTION_COMPONENT_KEYS), dtype=np.float64)
+        other = _DISTRIBUTION_COMPONENT_INDEX["other"]
+        for key, amount in self.trust_distribution_components.items():
+            components[_DISTRIBUTION_COMPONENT_INDEX.get(key, other)] += amount
+        return components
+
 
 class DeductionFlows(BaseModel):
     work_related_expenses_total: float = 0.0
@@ -382,17 +515,130 @@ class CashflowContext(BaseModel):
     )
 
 
+def _float_fields(model: type[BaseModel]) -> List[str]:
+    return [name for name, info in model.model_fields.items() if info.annotation is float]
+
+
+# Income columns that count towards gross income for PRO_RATA_GROSS allocation
+# (excludes rates, franking credits and foreign tax paid)
+_GROSS_INCOME_FIELDS = (
+    "salary_gross",
+    "bonus_gross",
+    "allowances_gross",
+    "business_income_net",
+    "interest_income",
+    "dividend_unfranked",
+    "dividend_franked",
+    "rental_income_gross",
+    "foreign_employment_income",
+    "foreign_investment_income",
+)
+
+
+@dataclass
+class CashflowTable:
+    """
+    Columnar copy of a CashflowContext: one float64 array per numeric flow field,
+    with row i holding entity_ids[i].
+
+    Flatten once from the validated CashflowContext before running CALs so that
+    household aggregates and expense allocation are whole-array operations.
+    Non-numeric fields (trust distributions, regular contribution schedules)
+    stay on the EntityCashflow models.
+    """
+
+    entity_ids: List[str]
+    entity_index: Dict[str, int]
+    income: Dict[str, np.ndarray]
+    deductions: Dict[str, np.ndarray]
+    contributions: Dict[str, np.ndarray]
+
+    @classmethod
+    def from_context(cls, cashflow_context: CashflowContext) -> "CashflowTable":
+        entity_ids = list(cashflow_context.flows)
+        flows = [cashflow_context.flows[entity_id] for entity_id in entity_ids]
+
+        def columns(group: str, model: type[BaseModel]) -> Dict[str, np.ndarray]:
+            return {
+                name: np.fromiter(
+                    (getattr(getattr(flow, group), name) for flow in flows),
+                    dtype=np.float64,
+                    count=len(flows),
+                )
+                for name in _float_fields(model)
+            }
+
+        return cls(
+            entity_ids=entity_ids,
+            entity_index={entity_id: i for i, entity_id in enumerate(entity_ids)},
+            income=columns("income", IncomeFlows),
+            deductions=columns("deductions", DeductionFlows),
+            contributions=columns("contributions", ContributionFlows),
+        )
+
+    def gross_income(self) -> np.ndarray:
+        """Gross income per entity."""
+        return np.add.reduce([self.income[name] for name in _GROSS_INCOME_FIELDS])
+
+    def total_deductions(self) -> np.ndarray:
+        """Sum of all deduction columns per entity."""
+        return np.add.reduce(list(self.deductions.values()))
+
+    def allocate_shared(self, amount: float, budget: HouseholdBudget) -> np.ndarray:
+        """
+        Split a shared household amount across entities per the budget's allocation strategy.
+
+        custom_split_ratios, when set, override the strategy; entities without
+        a ratio receive nothing.
+        """
+        n_entities = len(self.entity_ids)
+        allocation = np.zeros(n_entities, dtype=np.float64)
+        if n_entities == 0:
+            return allocation
+
+        rules = budget.allocation_rules
+        if rules.custom_split_ratios:
+            for entity_id, ratio in rules.custom_split_ratios.items():
+                if entity_id in self.entity_index:
+                    allocation[self.entity_index[entity_id]] = amount * ratio
+            return allocation
+
+        if budget.allocation_strategy == "PRO_RATA_GROSS":
+            gross = self.gross_income()
+            total_gross = gross.sum()
+            if total_gross > 0:
+                return amount * (gross / total_gross)
+        elif budget.allocation_strategy == "PRIMARY_ABSORBS":
+            if rules.primary_earner_id in self.entity_index:
+                allocation[self.entity_index[rules.primary_earner_id]] = amount
+                return allocation
+
+        # EQUAL_SPLIT, and the fallback when the strategy cannot be applied
+        allocation.fill(amount / n_entities)
+        return allocation
+
+
 # ---------------------------------------------------------------------------
 # Global rules & assumptions
 # ---------------------------------------------------------------------------
 
 
-class TaxBracket(BaseModel):
+@dataclass
+class TaxBracket:
     threshold: float
     rate: float
     base: float
 
 
+def _pack_brackets(brackets: List[TaxBracket]) -> np.ndarray:
+    """Pack brackets into a float64 (N, 3) array of (threshold, rate, base), sorted by threshold."""
+    packed = np.array(
+        [(bracket.threshold, bracket.rate, bracket.base) for bracket in brackets],
+        dtype=np.float64,
+    ).reshape(-1, 3)
+    return packed[np.argsort(packed[:, 0], kind="stable")]
+
+
 class TaxSettings(BaseModel):
     financial_year: int
     resident_brackets: List[TaxBracket] = Field(default_factory=list)
@@ -405,6 +651,46 @@ class TaxSettings(BaseModel):
     lito_max: float = 0.0
     help_thresholds: Dict[str, Any] = Field(default_factory=dict)
 
+    # Packed copies of the bracket lists, rebuilt whenever the model is
+    # validated; model_construct skips validation, so the properties pack on
+    # first use when they are unset
+    _resident_brackets_array: Optional[np.ndarray] = PrivateAttr(default=None)
+    _non_resident_brackets_array: Optional[np.ndarray] = PrivateAttr(default=None)
+
+    @model_validator(mode="after")
+    def _pack_bracket_arrays(self) -> "TaxSettings":
+        self._resident_brackets_array = _pack_brackets(self.resident_brackets)
+        self._non_resident_brackets_array = _pack_brackets(self.non_resident_brackets)
+        return self
+
+    @property
+    def resident_brackets_array(self) -> np.ndarray:
+        if self._resident_brackets_array is None:
+            self._resident_brackets_array = _pack_brackets(self.resident_brackets)
+        return self._resident_brackets_array
+
+    @property
+    def non_resident_brackets_array(self) -> np.ndarray:
+        if self._non_resident_brackets_array is None:
+            self._non_resident_brackets_array = _pack_brackets(self.non_resident_brackets)
+        return self._non_resident_brackets_array
+
+    def tax_on(self, taxable_income: Union[float, np.ndarray], resident: bool = True) -> np.ndarray:
+        """
+        Tax on one or many taxable incomes: base + (income - threshold) * rate
+        of the bracket each income falls in, found with a binary search.
+        """
+        brackets = self.resident_brackets_array if resident else self.non_resident_brackets_array
+        income = np.asarray(taxable_income, dtype=np.float64)
+        if brackets.shape[0] == 0:
+            return np.zeros_like(income)
+
+        thresholds, rates, bases = brackets[:, 0], brackets[:, 1], brackets[:, 2]
+        idx = np.searchsorted(thresholds, income, side="right") - 1
+        in_range = idx >= 0
+        idx = np.maximum(idx, 0)
+        return np.where(in_range, bases[idx] + (income - thresholds[idx]) * rates[idx], 0.0)
+
 
 class SuperSettings(BaseModel):
     concessional_cap: float = 0.0
@@ -456,11 +742,80 @@ class EntityContext(BaseModel):
     household_budget: HouseholdBudget = Field(default_factory=HouseholdBudget)
 
 
+# Concrete asset models, dispatched on asset_type
+AssetUnion = Annotated[Union[PropertyAsset, GeneralAsset], Field(discriminator="asset_type")]
+
+
 class FinancialPositionContext(BaseModel):
-    assets: Dict[str, Asset] = Field(default_factory=dict)
+    assets: Dict[str, AssetUnion] = Field(default_factory=dict)
     liabilities: Dict[str, Loan] = Field(default_factory=dict)
 
 
+# Holding cost columns of PropertyTable.costs, in column order
+PROPERTY_COST_FIELDS = (
+    "council_rates",
+    "water_rates",
+    "strata_body_corporate",
+    "land_tax",
+    "building_insurance",
+    "landlord_insurance",
+    "repairs_maintenance",
+    "property_management_fees",
+    "other_property_costs",
+)
+
+
+@dataclass
+class PropertyTable:
+    """
+    Columnar copy of the PropertyAssets in a FinancialPositionContext, with row i
+    holding asset_ids[i].
+
+    PropertyAsset remains the ingest schema; flatten once so that per-property
+    aggregates (e.g. annual holding cost) are whole-array operations.
+    """
+
+    asset_ids: np.ndarray
+    asset_index: Dict[str, int]
+    costs: np.ndarray  # (n_properties, len(PROPERTY_COST_FIELDS))
+    weekly_rent: np.ndarray
+    occupancy_rate: np.ndarray
+    rent_indexation_rate: np.ndarray
+
+    @classmethod
+    def from_assets(cls, assets: Dict[str, Asset]) -> "PropertyTable":
+        properties = [asset for asset in assets.values() if isinstance(asset, PropertyAsset)]
+        n_properties = len(properties)
+
+        def column(name: str) -> np.ndarray:
+            return np.fromiter(
+                (getattr(asset, name) for asset in properties),
+                dtype=np.float64,
+                count=n_properties,
+            )
+
+        costs = np.empty((n_properties, len(PROPERTY_COST_FIELDS)), dtype=np.float64)
+        for j, name in enumerate(PROPERTY_COST_FIELDS):
+            costs[:, j] = column(name)
+
+        return cls(
+            asset_ids=np.array([asset.id for asset in properties], dtype=object),
+            asset_index={asset.id: i for i, asset in enumerate(properties)},
+            costs=costs,
+            weekly_rent=column("weekly_rent_current"),
+            occupancy_rate=column("expected_occupancy_rate"),
+            rent_indexation_rate=column("rent_indexation_rate"),
+        )
+
+    def annual_holding_costs(self) -> np.ndarray:
+        """Total annual holding cost per property."""
+        return self.costs.sum(axis=1)
+
+    def annual_rent(self) -> np.ndarray:
+        """Expected gross annual rent per property (52 weeks at the occupancy rate)."""
+        return self.weekly_rent * 52.0 * self.occupancy_rate
+
+
 # ---------------------------------------------------------------------------
 # Calculated intermediaries – namespaced by entity + plan-level + trace
 # ---------------------------------------------------------------------------
@@ -480,7 +835,7 @@ class TaxResults(BaseModel):
     effective_tax_rate: Optional[float] = None
 
 
-class SuperResults(BaseModel):
+class SuperResults(_YearSeriesModel):
     cc_total: Optional[float] = None
     cc_cap_remaining: Optional[float] = None
     ncc_total: Optional[float] = None
@@ -488,21 +843,21 @@ class SuperResults(BaseModel):
     contributions_tax: Optional[float] = None
     division_293_tax: Optional[float] = None
     net_contribution_to_balance: Optional[float] = None
-    super_balance_projection: Dict[int, float] = Field(default_factory=dict)
+    super_balance_projection: YearSeries = Field(default_factory=_empty_year_series)
     pension_minimum_required: Optional[float] = None
     super_runway_years: Optional[float] = None
 
 
-class PropertyResults(BaseModel):
+class PropertyResults(_YearSeriesModel):
     rental_cashflow_before_tax: Optional[float] = None
     rental_cashflow_after_tax: Optional[float] = None
     rental_yield_gross: Optional[float] = None
     rental_yield_net: Optional[float] = None
-    property_equity_over_time: Dict[int, float] = Field(default_factory=dict)
+    property_equity_over_time: YearSeries = Field(default_factory=_empty_year_series)
 
 
-class PortfolioResults(BaseModel):
-    investment_balance_projection: Dict[int, float] = Field(default_factory=dict)
+class PortfolioResults(_YearSeriesModel):
+    investment_balance_projection: YearSeries = Field(default_factory=_empty_year_series)
     portfolio_fees_dollar: Optional[float] = None
     portfolio_risk_indicator: Optional[float] = None
 
@@ -515,30 +870,29 @@ class EntityResults(BaseModel):
     # Extend with insurance, social security, etc. as needed
 
 
-class PlanLevelResults(BaseModel):
-    net_wealth_by_year: Dict[int, float] = Field(default_factory=dict)
+class PlanLevelResults(_YearSeriesModel):
+    net_wealth_by_year: YearSeries = Field(default_factory=_empty_year_series)
     scenario_delta_summary: Dict[str, Any] = Field(default_factory=dict)
     financial_independence_age: Optional[int] = None
     retirement_funding_gap: Optional[float] = None
     risk_resilience_scores: Dict[str, Any] = Field(default_factory=dict)
 
 
-class TraceEntry(BaseModel):
+@dataclass
+class TraceEntry:
     calc_id: str
     entity_id: Optional[str] = None
     field: Optional[str] = None
 
-    year_index: Optional[int] = Field(
-        default=None,
+    year_index: Annotated[Optional[int], Field(
         description="Projection year index (0 = base year). None for single-year runs.",
-    )
-    severity: TraceSeverity = Field(
-        default="info",
+    )] = None
+    severity: Annotated[TraceSeverity, Field(
         description="Helps filter which traces to surface (info, warning, decision_point).",
-    )
+    )] = "info"
 
     explanation: Optional[str] = None
-    metadata: Dict[str, Any] = Field(default_factory=dict)
+    metadata: Dict[str, Any] = dataclass_field(default_factory=dict)
 
 
 class CalculatedIntermediariesContext(BaseModel):
@@ -604,3 +958,24 @@ class ProjectionOutput(BaseModel):
 
     base_state: CalculationState
     timeline: List[YearSnapshot] = Field(default_factory=list)
+
+
+def model_validate_state(data: Any) -> CalculationState:
+    """
+    Validate raw input (e.g. a parsed request body) into a CalculationState.
+
+    This is the single validation point; the dataclass leaves above are
+    checked here and trusted afterwards.
+    """
+    return CalculationState.model_validate(data)
+
+
+def decode_state(raw: Union[str, bytes]) -> CalculationState:
+    """
+    Parse and validate a JSON-encoded CalculationState in a single pass.
+
+    Prefer this over json.loads + model_validate_state for request bodies and
+    stored blobs: pydantic-core parses the JSON straight into the validator
+    without building an intermediate dict tree.
+    """
+    return CalculationState.model_validate_json(raw)
@@ -1,9 +1,18 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
+from dataclasses import dataclass, fields
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+from pydantic import TypeAdapter
 
 from calculation_engine.schemas.calculation import CalculationState
-from calculation_engine.schemas.orchestration import TraceEntry, TraceSeverity
+from calculation_engine.utils.calculation_state import TraceEntry, TraceSeverity
+
+_TRACE_ENTRIES_ADAPTER = TypeAdapter(List[TraceEntry])
+_TRACE_ENTRY_FIELDS = tuple(f.name for f in fields(TraceEntry))
+
+SEVERITY_CODES: Dict[str, int] = {"info": 0, "warning": 1, "decision_point": 2}
 
 
 def add_trace(
@@ -20,6 +29,12 @@ def add_trace(
     """
     Append a trace entry to the state's intermediates.trace_log.
 
+    Entries are stored as plain dicts with the TraceEntry fields (metadata is
+    left as None when not given); call finalize_traces() to validate them
+    when traces are surfaced. Info entries
+    are sampled per state.trace_info_sampling; warnings and decision points
+    are always recorded. Nothing is recorded when state.trace_enabled is off.
+
     Typical usage inside a CAL function:
         add_trace(
             state,
@@ -32,17 +47,127 @@ def add_trace(
             metadata={"taxable_income": taxable_income, "bracket_rate": 0.45},
         )
     """
+    intermediates = state.intermediates
+    sampling = state.trace_info_sampling
+    if severity == "info" and sampling > 1:
+        count = intermediates._info_trace_count
+        intermediates._info_trace_count = count + 1
+        if count % sampling:
+            return
+    if not state.trace_enabled:
+        return
 
-    entry = TraceEntry(
-        calc_id=calc_id,
-        entity_id=entity_id,
-        field=field,
-        year_index=year_index,
-        severity=severity,
-        explanation=explanation,
-        metadata=metadata or {},
-    )
-    state.intermediates.trace_log.append(entry)
+    intermediates.trace_log.append({
+        "calc_id": calc_id,
+        "entity_id": entity_id,
+        "field": field,
+        "year_index": year_index,
+        "severity": severity,
+        "explanation": explanation,
+        "metadata": metadata,
+    })
+
+
+def finalize_traces(state: CalculationState) -> List[TraceEntry]:
+    """
+    Validate the state's trace_log into TraceEntry records in one pass.
+
+    Call once when a projection completes or when traces are surfaced to
+    the LLM, rather than validating each entry as it is added. Entries
+    appended directly by CAL functions as models are read by attribute.
+    """
+    entries = []
+    for entry in state.intermediates.trace_log:
+        if not isinstance(entry, dict):
+            entry = {name: getattr(entry, name) for name in _TRACE_ENTRY_FIELDS if hasattr(entry, name)}
+        if entry.get("metadata") is None:
+            entry = {**entry, "metadata": {}}
+        entries.append(entry)
+    return _TRACE_ENTRIES_ADAPTER.validate_python(entries)
+
+
+def _entry_value(entry: Any, name: str, default: Any = None) -> Any:
+    """Read a trace field from a dict entry or a TraceEntry-like model."""
+    if isinstance(entry, dict):
+        return entry.get(name, default)
+    return getattr(entry, name, default)
+
+
+@dataclass
+class TraceColumns:
+    """
+    Columnar copy of a trace_log for filtering.
+
+    Severity and year are numpy columns so filters such as "decision points
+    for entity X in year Y" are boolean masks rather than list scans.
+    year_index is -1 where an entry has no year. Metadata is a side table
+    keyed by row, holding only the entries that carry any.
+    """
+    calc_id: List[str]
+    entity_id: np.ndarray  # object dtype
+    field: List[Optional[str]]
+    year_index: np.ndarray  # int32
+    severity: np.ndarray  # uint8 codes from SEVERITY_CODES
+    explanation: List[Optional[str]]
+    metadata: Dict[int, Dict[str, Any]]
+
+    @classmethod
+    def from_trace_log(cls, trace_log: Iterable[Any]) -> "TraceColumns":
+        """Build columns from trace entries (dicts from add_trace or TraceEntry models)."""
+        entries = list(trace_log)
+        year_indexes = (_entry_value(entry, "year_index") for entry in entries)
+        return cls(
+            calc_id=[_entry_value(entry, "calc_id") for entry in entries],
+            entity_id=np.array([_entry_value(entry, "entity_id") for entry in entries], dtype=object),
+            field=[_entry_value(entry, "field") for entry in entries],
+            year_index=np.fromiter(
+                (-1 if year is None else year for year in year_indexes), dtype=np.int32, count=len(entries)
+            ),
+            severity=np.fromiter(
+                (SEVERITY_CODES[_entry_value(entry, "severity", "info")] for entry in entries),
+                dtype=np.uint8,
+                count=len(entries)
+            ),
+            explanation=[_entry_value(entry, "explanation") for entry in entries],
+            metadata={
+                i: metadata
+                for i, metadata in enumerate(_entry_value(entry, "metadata") for entry in entries)
+                if metadata
+            },
+        )
+
+    def mask(
+        self,
+        *,
+        severity: Optional[TraceSeverity] = None,
+        entity_id: Optional[str] = None,
+        year_index: Optional[int] = None,
+    ) -> np.ndarray:
+        """Boolean mask of the entries matching every given filter."""
+        selected = np.ones(self.severity.shape[0], dtype=bool)
+        if severity is not None:
+            selected &= self.severity == SEVERITY_CODES[severity]
+        if entity_id is not None:
+            selected &= self.entity_id == entity_id
+        if year_index is not None:
+            selected &= self.year_index == year_index
+        return selected
+
+    def rows(self, mask: np.ndarray) -> List[Dict[str, Any]]:
+        """Materialise the entries selected by `mask` as trace dicts."""
+        severity_names = list(SEVERITY_CODES)
+        return [
+            {
+                "calc_id": self.calc_id[i],
+                "entity_id": self.entity_id[i],
+                "field": self.field[i],
+                "year_index": None if self.year_index[i] < 0 else int(self.year_index[i]),
+                "severity": severity_names[self.severity[i]],
+                "explanation": self.explanation[i],
+                "metadata": self.metadata.get(i, {}),
+            }
+            for i in np.flatnonzero(mask).tolist()
+        ]
 
 
 # Convenience wrappers if you want them:
@@ -0,0 +1,185 @@
+"""
+Valuation primitives - projected asset values and loan balances.
+
+This module implements the deterministic per-year projection primitives that
+PropertyAsset.value_at and Loan.balance_at delegate to, and a ValuationCache
+that memoises them for the duration of a projection run.
+"""
+
+from datetime import date
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
+from numba import njit
+
+from calculation_engine.utils.calculation_state import Loan, PropertyAsset
+
+# Repayment periods per year for each RepaymentFrequency
+PERIODS_PER_YEAR: Dict[str, int] = {"monthly": 12, "fortnightly": 26, "weekly": 52}
+
+_DAYS_PER_YEAR = 365.25
+
+
+def _years_between(start: date, end: date) -> float:
+    return (end - start).days / _DAYS_PER_YEAR
+
+
+def property_value_at(asset: PropertyAsset, target_date: date, default_growth_rate: float) -> float:
+    """
+    Project a property's value from its valuation date to target_date.
+
+    Compounds annually at the asset's custom_capital_growth_rate, or
+    default_growth_rate when none is set.
+    """
+    return float(_compound_kernel(
+        np.array([asset.valuation.amount]),
+        np.array([_growth_rate(asset, default_growth_rate)]),
+        np.array([_years_between(asset.valuation.effective_date, target_date)]),
+    )[0])
+
+
+def loan_balance_at(loan: Loan, as_at: date, target_date: date) -> float:
+    """
+    Project a loan's outstanding principal from as_at to target_date.
+
+    Repayments of repayment_amount_actual are made at the loan's repayment
+    frequency; no principal is repaid during the remaining interest-only
+    period. Offset and redraw balances are not modelled.
+    """
+    return float(amortise_batch(*_loan_rows([loan], as_at, target_date))[0])
+
+
+def _growth_rate(asset: PropertyAsset, default_growth_rate: float) -> float:
+    if asset.custom_capital_growth_rate is not None:
+        return asset.custom_capital_growth_rate
+    return default_growth_rate
+
+
+def _loan_rows(loans: List[Loan], as_at: date, target_date: date) -> Tuple[np.ndarray, ...]:
+    """Flatten loans into the per-period arrays amortise_batch takes."""
+    years = _years_between(as_at, target_date)
+    n = len(loans)
+    principal = np.empty(n)
+    rate = np.empty(n)
+    repayment = np.empty(n)
+    periods = np.empty(n, dtype=np.int64)
+    io_periods = np.empty(n, dtype=np.int64)
+    for i, loan in enumerate(loans):
+        periods_per_year = PERIODS_PER_YEAR[loan.repayment_frequency]
+        principal[i] = loan.principal_outstanding
+        rate[i] = loan.interest_rate_current / periods_per_year
+        repayment[i] = loan.repayment_amount_actual
+        periods[i] = int(years * periods_per_year)
+        io_periods[i] = int(loan.interest_only_remaining_years * periods_per_year) if loan.interest_only_flag else 0
+    return principal, rate, repayment, periods, io_periods
+
+
+@njit(cache=True)
+def amortise_batch(principal, rate, repayment, periods, io_periods):
+    """
+    Outstanding balance of each loan after periods[i] repayment periods.
+
+    The first io_periods[i] periods are interest only; the remainder amortise
+    at the per-period rate[i] with repayment[i] per period, floored at zero.
+    """
+    n = principal.shape[0]
+    out = np.empty(n)
+    for i in range(n):
+        amortising = periods[i] - io_periods[i]
+        if amortising <= 0:
+            out[i] = principal[i]
+        elif rate[i] == 0.0:
+            out[i] = max(principal[i] - repayment[i] * amortising, 0.0)
+        else:
+            growth = (1.0 + rate[i]) ** amortising
+            out[i] = max(principal[i] * growth - repayment[i] * (growth - 1.0) / rate[i], 0.0)
+    return out
+
+
+@njit(cache=True)
+def _compound_kernel(values, growth_rates, years):
+    """values[i] compounded at growth_rates[i] over years[i] (fractional) years."""
+    n = values.shape[0]
+    out = np.empty(n)
+    for i in range(n):
+        out[i] = values[i] * (1.0 + growth_rates[i]) ** years[i]
+    return out
+
+
+@njit(cache=True)
+def project_value_batch(values, growth_rates, n_years):
+    """
+    Year-by-year values matrix of shape (len(values), n_years).
+
+    Column 0 is the starting value; each later column grows the previous one
+    by one year at that row's rate.
+    """
+    n = values.shape[0]
+    out = np.empty((n, n_years))
+    for i in range(n):
+        factor = 1.0 + growth_rates[i]
+        value = values[i]
+        for year in range(n_years):
+            out[i, year] = value
+            value *= factor
+    return out
+
+
+class ValuationCache:
+    """
+    Per-projection memo of asset values and loan balances.
+
+    Inputs do not change within a projection run, so loan balances are keyed
+    by (id, target_date) and asset values by (id, target_date, growth rate
+    applied), and reused across years and callers. Create one per scenario
+    (or call clear() between scenarios), not per year.
+    """
+
+    def __init__(self, as_at: date):
+        """
+        Args:
+            as_at: Date the loans' current balances are stated at (the
+                projection's effective date)
+        """
+        self.as_at = as_at
+        self.value_cache: Dict[Tuple[str, date, float], float] = {}
+        self.balance_cache: Dict[Tuple[str, date], float] = {}
+
+    def clear(self) -> None:
+        """Forget all cached values and balances."""
+        self.value_cache.clear()
+        self.balance_cache.clear()
+
+    def value_at(self, asset: PropertyAsset, target_date: date, default_growth_rate: float) -> float:
+        """Memoised property_value_at for asset on target_date."""
+        # Key on the rate actually applied so sensitivity sweeps over
+        # default_growth_rate do not reuse values grown at another rate
+        key = (asset.id, target_date, _growth_rate(asset, default_growth_rate))
+        cached = self.value_cache.get(key)
+        if cached is not None:
+            return cached
+
+        value = property_value_at(asset, target_date, default_growth_rate)
+        self.value_cache[key] = value
+        return value
+
+    def balance_at(self, loan: Loan, target_date: date) -> float:
+        """Memoised loan_balance_at for loan on target_date."""
+        key = (loan.id, target_date)
+        cached = self.balance_cache.get(key)
+        if cached is not None:
+            return cached
+
+        balance = loan_balance_at(loan, self.as_at, target_date)
+        self.balance_cache[key] = balance
+        return balance
+
+    def balances_at(self, loans: Iterable[Loan], target_date: date) -> List[float]:
+        """Balances of every loan on target_date, amortising uncached loans in one batch."""
+        loans = list(loans)
+        missing = [loan for loan in loans if (loan.id, target_date) not in self.balance_cache]
+        if missing:
+            balances = amortise_batch(*_loan_rows(missing, self.as_at, target_date))
+            for loan, balance in zip(missing, balances):
+                self.balance_cache[(loan.id, target_date)] = float(balance)
+        return [self.balance_cache[(loan.id, target_date)] for loan in loans]
@@ -10,12 +10,64 @@ Usage:
 """
 
 import os
+import re
 import sys
+import ast
 import json
 import argparse
+import functools
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_module_file(module: str, backend_root: str) -> Tuple[str, ...]:
+    """
+    Find the backend file providing `module`, as a path relative to backend_root.
+
+    Cached because the same modules are imported by many scripts and each
+    lookup costs up to four stat() calls.
+    """
+    module_path = module.replace('.', '/')
+    possible_paths = [
+        f"src/{module_path}.py",
+        f"src/{module_path}/__init__.py",
+        f"{module_path}.py",
+        f"{module_path}/__init__.py",
+    ]
+
+    root = Path(backend_root)
+    for path_str in possible_paths:
+        if (root / path_str).exists():
+            return (path_str,)
+
+    return ()
+
+
+# Opening triple quote of a docstring, then its first non-blank line (up to
+# the closing quote or end of line)
+_DOCSTRING_RE = re.compile(r'^[ \t]*("""|\'\'\')\s*([^\n]*?)[ \t]*(?:\1|$)', re.MULTILINE)
+
+# Node types whose children may contain import statements
+_STATEMENT_CONTAINERS = (ast.stmt, ast.excepthandler) + ((ast.match_case,) if hasattr(ast, 'match_case') else ())
+
+
+def _iter_import_nodes(tree: ast.Module):
+    """
+    Yield every Import/ImportFrom node in a parsed module.
+
+    Descends only through statements (function and class bodies, if/try/with
+    blocks, etc.), never into expressions, so it visits a fraction of the
+    nodes ast.walk would.
+    """
+    stack = list(tree.body)
+    while stack:
+        node = stack.pop()
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            yield node
+        else:
+            stack.extend(child for child in ast.iter_child_nodes(node) if isinstance(child, _STATEMENT_CONTAINERS))
 
 
 class TrackingEntryGenerator:
@@ -33,6 +85,21 @@ class TrackingEntryGenerator:
 
         self.tracking_file = self.backend_root / 'script_tracking.json'
 
+        # Roots scripts may live under, precomputed for prefix checks
+        self._frontend_root = self.backend_root.parent / 'frontend'
+        self._backend_root_str = str(self.backend_root)
+        self._frontend_root_str = str(self._frontend_root)
+
+        # Tracking file contents and script_name index, reloaded only when the
+        # file's mtime changes
+        self._loaded = False
+        self._tracking_mtime: Optional[int] = None
+        self._tracking_data: List[Dict] = []
+        self._script_name_index: set = set()
+
+        # Parsed dependencies per (script path, mtime)
+        self._dependency_cache: Dict[Tuple[str, float], List[str]] = {}
+
     def generate_entry(self, script_path: str, description: str = None, engine: str = None) -> Dict:
         """Generate a tracking entry for a script."""
 
@@ -44,13 +111,14 @@ class TrackingEntryGenerator:
 
         # Validate script is in allowed location (backend or frontend)
         script_str = str(script_path)
-        if not (script_str.startswith(str(self.backend_root)) or script_str.startswith(str(self.backend_root.parent / 'frontend'))):
+        in_backend = script_str.startswith(self._backend_root_str)
+        if not (in_backend or script_str.startswith(self._frontend_root_str)):
             raise ValueError(f"Script must be within backend or frontend directory: {script_path}")
 
         # Get relative path
-        if script_str.startswith(str(self.backend_root)):
+        if in_backend:
             relative_path = script_path.relative_to(self.backend_root)
-        elif script_str.startswith(str(self.backend_root.parent / 'frontend')):
+        elif script_str.startswith(self._frontend_root_str):
             # For frontend scripts, keep the full frontend/ path
             relative_path = script_path.relative_to(self.backend_root.parent)
         else:
@@ -60,12 +128,15 @@ class TrackingEntryGenerator:
         if engine is None:
             engine = self._detect_engine_from_path(relative_path)
 
+        # Read the script once for both the description and the dependency scan
+        source = script_path.read_bytes()
+
         # Auto-generate description if not provided
         if description is None:
-            description = self._generate_description(script_path, relative_path)
+            description = self._generate_description(script_path, relative_path, source)
 
         # Analyze dependencies
-        interacts_with = self._analyze_dependencies(script_path, relative_path)
+        interacts_with = self._analyze_dependencies(script_path, relative_path, source)
 
         # Create entry
         entry = {
@@ -83,8 +154,54 @@ class TrackingEntryGenerator:
     def add_entry_to_tracking_file(self, entry: Dict):
         """Add entry to the tracking file."""
 
+        self.add_entries([entry])
+
+    def add_entries(self, entries: List[Dict]):
+        """Add several entries to the tracking file with a single load and write."""
+
+        self._load_tracking()
+
+        # Check for duplicates, within the batch as well as against the file
+        batch_scripts = set()
+        for entry in entries:
+            script_name = entry['script_name']
+            if script_name in self._script_name_index or script_name in batch_scripts:
+                raise ValueError(f"Script '{script_name}' already has a tracking entry")
+            batch_scripts.add(script_name)
+
+        # Add new entries to a copy; the cached state only changes once the
+        # file on disk does
+        tracking_data = self._tracking_data + list(entries)
+        script_name_index = self._script_name_index | batch_scripts
+
+        # Write back to file: serialise in memory, write a temp file, then rename
+        # over the original so a failed write never leaves truncated JSON behind
+        tmp_file = self.tracking_file.with_suffix('.json.tmp')
+        tmp_file.write_text(json.dumps(tracking_data, indent=2))
+        os.replace(tmp_file, self.tracking_file)
+
+        self._tracking_data = tracking_data
+        self._script_name_index = script_name_index
+        self._tracking_mtime = self._tracking_file_mtime()
+
+        for entry in entries:
+            print(f"✅ Added tracking entry for {entry['script_name']}")
+
+    def _tracking_file_mtime(self) -> Optional[int]:
+        try:
+            return self.tracking_file.stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    def _load_tracking(self):
+        """Load the tracking file and index its script names, unless unchanged since last load."""
+
+        mtime = self._tracking_file_mtime()
+        if self._loaded and mtime == self._tracking_mtime:
+            return
+
         # Load existing tracking data
-        if self.tracking_file.exists():
+        if mtime is not None:
             try:
                 with open(self.tracking_file, 'r') as f:
                     tracking_data = json.load(f)
@@ -94,77 +211,50 @@ class TrackingEntryGenerator:
         else:
             tracking_data = []
 
-        # Check for duplicates
-        existing_scripts = {item.get('script_name') for item in tracking_data if isinstance(item, dict)}
-        if entry['script_name'] in existing_scripts:
-            raise ValueError(f"Script '{entry['script_name']}' already has a tracking entry")
-
-        # Add new entry
-        tracking_data.append(entry)
-
-        # Write back to file
-        with open(self.tracking_file, 'w') as f:
-            json.dump(tracking_data, f, indent=2)
-
-        print(f"✅ Added tracking entry for {entry['script_name']}")
+        self._tracking_data = tracking_data
+        self._script_name_index = {item.get('script_name') for item in tracking_data if isinstance(item, dict)}
+        self._loaded = True
+        self._tracking_mtime = mtime
+
+    # Path prefix -> engine, checked in order
+    _ENGINE_PREFIXES = (
+        ('frontend/', 'frontend'),
+        ('calculation_engine/', 'calculation_engine'),
+        ('llm_orchestrator/', 'llm_orchestrator'),
+        ('src/engines/llm/', 'llm_orchestrator'),
+        ('strategy_engine/', 'strategy_engine'),
+        ('src/engines/strategy/', 'strategy_engine'),
+        ('advice_engine/', 'advice_engine'),
+        ('src/engines/advice/', 'advice_engine'),
+    )
 
     def _detect_engine_from_path(self, relative_path: Path) -> str:
         """Detect engine from script path."""
 
         path_str = str(relative_path)
 
-        # Frontend scripts
-        if path_str.startswith('frontend/'):
-            return 'frontend'
-
-        # Backend scripts
-        if path_str.startswith('calculation_engine/'):
-            return 'calculation_engine'
-        elif path_str.startswith('llm_orchestrator/') or path_str.startswith('src/engines/llm/'):
-            return 'llm_orchestrator'
-        elif path_str.startswith('strategy_engine/') or path_str.startswith('src/engines/strategy/'):
-            return 'strategy_engine'
-        elif path_str.startswith('advice_engine/') or path_str.startswith('src/engines/advice/'):
-            return 'advice_engine'
-        elif path_str.startswith(('shared/', 'src/', 'tests/', 'alembic/')):
-            return 'shared'
-        else:
-            return 'shared'  # Default
+        for prefix, engine in self._ENGINE_PREFIXES:
+            if path_str.startswith(prefix):
+                return engine
+
+        # shared/, src/, tests/, alembic/ and anything else
+        return 'shared'
 
-    def _generate_description(self, script_path: Path, relative_path: Path) -> str:
-        """Generate a description for the script."""
+    def _generate_description(self, script_path: Path, relative_path: Path, source: Optional[bytes] = None) -> str:
+        """Generate a description for the script (from `source` when already read)."""
 
         # Try to read the file and extract docstring or class/function names
         try:
-            with open(script_path, 'r', encoding='utf-8') as f:
-                content = f.read(1000)  # Read first 1000 chars
-
-            # Look for module docstring
-            lines = content.split('\n')[:10]  # First 10 lines
-            in_docstring = False
-            docstring_lines = []
-
-            for line in lines:
-                line = line.strip()
-                if line.startswith('"""') or line.startswith("'''"):
-                    if in_docstring:
-                        break
-                    in_docstring = True
-                    # Remove opening quotes
-                    line = line[3:].strip()
-                    if line:
-                        docstring_lines.append(line)
-                elif in_docstring and (line.endswith('"""') or line.endswith("'''")):
-                    # Remove closing quotes
-                    line = line[:-3].strip()
-                    if line:
-                        docstring_lines.append(line)
-                    break
-                elif in_docstring:
-                    docstring_lines.append(line)
-
-            if docstring_lines:
-                return docstring_lines[0][:100]
+            if source is None:
+                with open(script_path, 'rb') as f:
+                    source = f.read(1000)
+            content = source[:1000].decode('utf-8', errors='replace')  # First 1000 bytes
+
+            # Look for a docstring in the first 10 lines and take its first non-blank line
+            head = '\n'.join(content.split('\n', 10)[:10])
+            match = _DOCSTRING_RE.search(head)
+            if match and match.group(2):
+                return match.group(2)[:100]
 
         except Exception:
             pass
@@ -188,120 +278,98 @@ class TrackingEntryGenerator:
         else:
             return f"Python script for {dirname or 'backend'} functionality"
 
-    def _analyze_dependencies(self, script_path: Path, relative_path: Path) -> List[str]:
-        """Analyze script dependencies."""
+    def _analyze_dependencies(self, script_path: Path, relative_path: Path, source: Optional[bytes] = None) -> List[str]:
+        """Analyze script dependencies (from `source` when already read)."""
+
+        try:
+            cache_key = (str(script_path), script_path.stat().st_mtime)
+        except OSError:
+            cache_key = None
+        if cache_key in self._dependency_cache:
+            return self._dependency_cache[cache_key]
 
         dependencies = []
 
         try:
-            with open(script_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-
-            # Look for import statements
-            lines = content.split('\n')
-            for line in lines:
-                line = line.strip()
-
-                # Skip comments and empty lines
-                if not line or line.startswith('#'):
-                    continue
-
-                # Handle different import types
-                if line.startswith('from ') and 'import' in line:
-                    # from module import item
-                    parts = line.split()
-                    if len(parts) >= 4 and parts[0] == 'from':
-                        module = parts[1]
-                        if module.startswith('.'):
-                            # Relative import - try to resolve
-                            dependencies.extend(self._resolve_relative_import(module, relative_path))
-                        else:
-                            # Absolute import within backend
-                            dependencies.extend(self._resolve_absolute_import(module))
-
-                elif line.startswith('import '):
+            # Raw bytes; ast.parse decodes per the file's encoding declaration
+            if source is None:
+                with open(script_path, 'rb') as f:
+                    source = f.read()
+
+            # Collect import statements anywhere in the module
+            tree = ast.parse(source, filename=str(script_path))
+            for node in _iter_import_nodes(tree):
+                if isinstance(node, ast.ImportFrom):
+                    if node.level and node.module:
+                        # from .module import item
+                        dependencies.extend(self._resolve_relative_import(node.module, node.level, relative_path))
+                    elif node.level:
+                        # from . import module, ... - each name is a submodule, or
+                        # else something the package __init__.py defines
+                        for alias in node.names:
+                            dependencies.extend(
+                                self._resolve_relative_import(alias.name, node.level, relative_path)
+                                or self._resolve_relative_import(None, node.level, relative_path)
+                            )
+                    elif node.module:
+                        # from module import item - absolute import within backend
+                        dependencies.extend(self._resolve_absolute_import(node.module))
+
+                elif isinstance(node, ast.Import):
                     # import module
-                    parts = line.split()
-                    if len(parts) >= 2:
-                        module = parts[1].split('.')[0]  # Get root module
+                    for alias in node.names:
+                        module = alias.name.split('.')[0]  # Get root module
                         dependencies.extend(self._resolve_absolute_import(module))
 
         except Exception as e:
             print(f"Warning: Could not analyze dependencies for {script_path}: {e}")
 
-        # Remove duplicates and sort
-        return sorted(list(set(dependencies)))
-
-    def _resolve_relative_import(self, module: str, current_path: Path) -> List[str]:
-        """Resolve relative imports to script paths."""
-        # This is a simplified implementation
-        # A full implementation would need proper Python import resolution
-
-        dependencies = []
+        # Remove duplicates and self-references, and sort
+        dependencies = sorted(set(dependencies) - {str(relative_path)})
+        if cache_key is not None:
+            self._dependency_cache[cache_key] = dependencies
+        return dependencies
 
-        # Convert relative import to path
-        if module.startswith('..'):
-            # Go up directories
-            up_levels = module.count('..')
-            remaining = module[up_levels * 3:]  # Remove the .. and dots
+    def _resolve_relative_import(self, module: Optional[str], level: int, current_path: Path) -> List[str]:
+        """Resolve a relative import (`level` leading dots) to script paths."""
 
-            # Navigate up
-            target_path = current_path
-            for _ in range(up_levels):
-                target_path = target_path.parent
+        # Level 1 is the current package; each further level goes up one directory
+        target_path = self.backend_root / current_path.parent
+        for _ in range(level - 1):
+            target_path = target_path.parent
 
-            # Add remaining path
-            if remaining:
-                remaining = remaining.lstrip('.')
-                target_path = target_path / remaining.replace('.', '/')
-            target_path = target_path.with_suffix('.py')
+        if module:
+            target_path = target_path / module.replace('.', '/')
 
-            if target_path.exists():
+        for candidate in (target_path.with_suffix('.py'), target_path / '__init__.py'):
+            if candidate.exists():
                 # Convert to relative path from backend
                 try:
-                    rel_path = target_path.relative_to(self.backend_root)
-                    dependencies.append(str(rel_path))
+                    return [str(candidate.relative_to(self.backend_root))]
                 except ValueError:
                     pass
 
-        return dependencies
+        return []
+
+    # Map common modules to script paths
+    _MODULE_MAPPINGS = {
+        'engines.calculation': ['calculation_engine/__init__.py'],
+        'engines.calculation.registry': ['calculation_engine/registry.py'],
+        'engines.calculation.domains': ['calculation_engine/domains/__init__.py'],
+        'models': ['src/models/__init__.py'],
+        'services': ['src/services/__init__.py'],
+        'routers': ['src/routers/__init__.py'],
+        'auth': ['src/auth/__init__.py'],
+        'config': ['src/config/__init__.py'],
+    }
 
     def _resolve_absolute_import(self, module: str) -> List[str]:
         """Resolve absolute imports within backend."""
 
-        # Map common modules to script paths
-        module_mappings = {
-            'engines.calculation': ['calculation_engine/__init__.py'],
-            'engines.calculation.registry': ['calculation_engine/registry.py'],
-            'engines.calculation.domains': ['calculation_engine/domains/__init__.py'],
-            'models': ['src/models/__init__.py'],
-            'services': ['src/services/__init__.py'],
-            'routers': ['src/routers/__init__.py'],
-            'auth': ['src/auth/__init__.py'],
-            'config': ['src/config/__init__.py'],
-        }
+        if module in self._MODULE_MAPPINGS:
+            return self._MODULE_MAPPINGS[module]
 
-        if module in module_mappings:
-            return module_mappings[module]
-
-        # Try to find the module file
-        possible_paths = [
-            f"src/{module.replace('.', '/')}.py",
-            f"src/{module.replace('.', '/')}/__init__.py",
-            f"{module.replace('.', '/')}.py",
-            f"{module.replace('.', '/')}/__init__.py",
-        ]
-
-        for path_str in possible_paths:
-            path = self.backend_root / path_str
-            if path.exists():
-                try:
-                    rel_path = path.relative_to(self.backend_root)
-                    return [str(rel_path)]
-                except ValueError:
-                    pass
-
-        return []
+        return list(_resolve_module_file(module, str(self.backend_root)))
 
     def _generate_purpose(self, script_path: Path, relative_path: Path, engine: str) -> str:
         """Generate a detailed purpose description."""
@@ -346,7 +414,9 @@ class TrackingEntryGenerator:
 
 def main():
     parser = argparse.ArgumentParser(description='Generate script tracking entry')
-    parser.add_argument('script_path', help='Path to the Python script')
+    parser.add_argument('script_path', nargs='?', help='Path to the Python script')
+    parser.add_argument('--script-paths-file', '-f',
+                       help='File listing script paths, one per line (batch mode)')
     parser.add_argument('--description', '-d', help='Custom description (auto-generated if not provided)')
     parser.add_argument('--engine', '-e', help='Engine type (auto-detected if not provided)')
     parser.add_argument('--add-to-tracking', '-a', action='store_true',
@@ -354,20 +424,32 @@ def main():
 
     args = parser.parse_args()
 
+    if args.script_paths_file:
+        with open(args.script_paths_file, 'r', encoding='utf-8') as f:
+            script_paths = [line.strip() for line in f if line.strip()]
+    elif args.script_path:
+        script_paths = [args.script_path]
+    else:
+        parser.error('a script path or --script-paths-file is required')
+
     generator = TrackingEntryGenerator()
 
     try:
-        entry = generator.generate_entry(
-            args.script_path,
-            description=args.description,
-            engine=args.engine
-        )
+        entries = [
+            generator.generate_entry(
+                script_path,
+                description=args.description,
+                engine=args.engine
+            )
+            for script_path in script_paths
+        ]
 
-        print("📝 Generated tracking entry:")
-        print(json.dumps(entry, indent=2))
+        for entry in entries:
+            print("📝 Generated tracking entry:")
+            print(json.dumps(entry, indent=2))
 
         if args.add_to_tracking:
-            generator.add_entry_to_tracking_file(entry)
+            generator.add_entries(entries)
         else:
             print("\n💡 Use --add-to-tracking to add this entry to the tracking file")
 
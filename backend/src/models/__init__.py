@@ -9,7 +9,7 @@ from .base import Base, BaseModel
 from .user_profile import UserProfile
 from .scenario import Scenario
 from .strategy import Strategy
-from .advice_outcome import AdviceOutcome
+from .advice_outcome import AdviceOutcome, AdviceOutcomeKey
 
 # Export all models
 __all__ = [
@@ -19,4 +19,5 @@ __all__ = [
     "Scenario",
     "Strategy",
     "AdviceOutcome",
+    "AdviceOutcomeKey",
 ]
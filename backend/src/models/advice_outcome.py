@@ -6,42 +6,72 @@ compliance checking results from the Advice Engine.
 """
 
 from typing import Optional, List, Dict, Any
-from sqlalchemy import Column, String, Text, JSON, Float, ForeignKey, Integer
+from sqlalchemy import Column, String, Text, Float, ForeignKey, Integer, Index, DateTime
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
 
-from .base import BaseModel
+from .base import Base, BaseModel
+
+
+class AdviceOutcomeKey(Base):
+    """
+    Registry of every advice_outcome_id issued.
+
+    advice_outcomes is range partitioned, so it cannot enforce a UNIQUE
+    constraint on advice_outcome_id alone. A database trigger on
+    advice_outcomes inserts each new id here first; the primary key rejects
+    duplicates across all partitions.
+    """
+
+    __tablename__ = "advice_outcome_keys"
+
+    advice_outcome_id = Column(String(255), primary_key=True)
 
 
 class AdviceOutcome(BaseModel):
     """Regulatory compliance checking results from Advice Engine."""
 
     __tablename__ = "advice_outcomes"
-
-    # Identity
-    advice_outcome_id = Column(String(255), unique=True, nullable=False, index=True)
+    __table_args__ = (
+        Index("ix_advice_outcomes_scenario_verdict", "scenario_id", "best_interest_duty_passed"),
+        Index("ix_advice_outcomes_approved_strategies_gin", "approved_strategies", postgresql_using="gin", postgresql_ops={"approved_strategies": "jsonb_path_ops"}),
+        Index("ix_advice_outcomes_rejected_strategies_gin", "rejected_strategies", postgresql_using="gin", postgresql_ops={"rejected_strategies": "jsonb_path_ops"}),
+        # Range partitioned by created_at: unique constraints must include the
+        # partition key, so advice_outcome_id uniqueness lives in advice_outcome_keys
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
+    # The table key is (id, created_at); id alone still identifies a row
+    __mapper_args__ = {"primary_key": ["id"]}
+
+    # Partition key, part of the table's primary key
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False, primary_key=True)
+
+    # Identity (globally unique via advice_outcome_keys; reserved by trigger on insert)
+    advice_outcome_id = Column(String(255), ForeignKey("advice_outcome_keys.advice_outcome_id"), nullable=False, index=True)
 
     # Link to scenario
-    scenario_id = Column(Integer, ForeignKey("scenarios.id"), nullable=False, index=True)
+    scenario_id = Column(Integer, ForeignKey("scenarios.id"), nullable=False)
 
     # Compliance assessment
     best_interest_duty_passed = Column(String(10), nullable=False)  # "PASS", "FAIL", "REVIEW"
-    compliance_warnings = Column(JSON, default=list)  # List of compliance warning messages
-    regulatory_citations = Column(JSON, default=list)  # List of regulatory reference document IDs
+    compliance_warnings = Column(JSONB, default=list)  # List of compliance warning messages
+    regulatory_citations = Column(JSONB, default=list)  # List of regulatory reference document IDs
 
     # Risk assessment
-    risk_warnings = Column(JSON, default=list)  # List of risk warning messages
+    risk_warnings = Column(JSONB, default=list)  # List of risk warning messages
     suitability_score = Column(Float)  # 0.0 to 1.0 suitability score
 
     # Strategy recommendations
-    approved_strategies = Column(JSON, default=list)  # List of approved strategy IDs
-    rejected_strategies = Column(JSON, default=dict)  # Dict of strategy_id -> rejection_reason
+    approved_strategies = Column(JSONB, default=list)  # List of approved strategy IDs
+    rejected_strategies = Column(JSONB, default=dict)  # Dict of strategy_id -> rejection_reason
 
     # Detailed assessment data
-    assessment_details = Column(JSON, default=dict)  # Detailed compliance assessment data
+    assessment_details = Column(JSONB, default=dict)  # Detailed compliance assessment data
 
     # Metadata
     assessed_by_clerk_id = Column(String(255), nullable=False)
-    assessment_version = Column(String(20), nullable=False, default="1.0")
+    assessment_version = Column(String(20), nullable=False, default="1.0", server_default="1.0")
 
     # Relationships
     scenario = relationship("Scenario", back_populates="advice_outcomes")
@@ -0,0 +1,70 @@
+"""
+Bulk backfill helpers for data migrations.
+
+This module provides a set-based alternative to row-by-row UPDATEs when a
+migration needs to rewrite a column on a large table such as `scenarios`:
+stage (key, value) pairs in a temporary table, then apply them with a single
+UPDATE ... FROM statement.
+"""
+
+from typing import Any, Iterable, Tuple
+
+import sqlalchemy as sa
+from sqlalchemy.engine import Connection
+
+
+def bulk_update_from_temp_table(
+    connection: Connection,
+    table_name: str,
+    column_name: str,
+    rows: Iterable[Tuple[Any, Any]],
+    value_type: sa.types.TypeEngine,
+    key_column: str = "id",
+    key_type: sa.types.TypeEngine = sa.Integer(),
+) -> int:
+    """
+    Apply many single-column updates with one UPDATE ... FROM statement.
+
+    Typical usage inside an Alembic migration:
+        with op.get_context().autocommit_block():
+            bulk_update_from_temp_table(
+                op.get_bind(), "scenarios", "last_calculated_at",
+                rows, sa.DateTime(timezone=True),
+            )
+
+    Args:
+        connection: Connection to run the backfill on (e.g. op.get_bind())
+        table_name: Table to update
+        column_name: Column to set on the target table
+        rows: Iterable of (key, new_value) pairs
+        value_type: SQL type of the new values
+        key_column: Column on the target table that matches each key
+        key_type: SQL type of the keys
+
+    Returns:
+        Number of rows updated on the target table
+    """
+    staging = sa.Table(
+        f"_backfill_{table_name}_{column_name}",
+        sa.MetaData(),
+        sa.Column("k", key_type, primary_key=True),
+        sa.Column("v", value_type),
+        prefixes=["TEMPORARY"],
+    )
+    params = [{"k": key, "v": value} for key, value in rows]
+    if not params:
+        return 0
+
+    staging.create(connection)
+    try:
+        # Multi-row insert into the staging table, then one set-based update
+        connection.execute(staging.insert(), params)
+        target = sa.table(table_name, sa.column(key_column), sa.column(column_name))
+        result = connection.execute(
+            target.update()
+            .where(target.c[key_column] == staging.c.k)
+            .values({column_name: staging.c.v})
+        )
+        return result.rowcount
+    finally:
+        staging.drop(connection, checkfirst=True)
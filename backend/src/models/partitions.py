@@ -0,0 +1,102 @@
+"""
+Range partition maintenance for time-partitioned tables.
+
+`advice_outcomes` is range partitioned by `created_at`, with a DEFAULT
+partition (`<table>_default`) created by the initial migration to catch rows
+no monthly partition covers. This module creates the monthly partitions;
+run `ensure_monthly_partitions` from a periodic job (e.g. a daily cron
+invoking a short script) so they exist ahead of time.
+
+PostgreSQL refuses to add a partition whose range overlaps rows already in
+DEFAULT, which is the normal state for the current month until the job first
+runs. `create_monthly_partition` therefore builds each partition as a
+standalone table, moves that month's rows out of DEFAULT into it, and then
+attaches it, all in the caller's transaction.
+"""
+
+from datetime import date
+from typing import List, Optional
+
+import sqlalchemy as sa
+from sqlalchemy.engine import Connection
+
+# Tables declared with postgresql_partition_by='RANGE (created_at)'
+PARTITIONED_TABLES = ("advice_outcomes",)
+
+
+def _add_months(month_start: date, months: int) -> date:
+    """Return the first day of the month `months` after `month_start`."""
+    index = month_start.year * 12 + month_start.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def create_monthly_partition(connection: Connection, table_name: str, month: date) -> str:
+    """
+    Create the partition of `table_name` covering the month containing `month`.
+
+    Any rows for that month already in the DEFAULT partition are moved into
+    the new partition. Run inside a transaction: the DEFAULT partition is
+    locked against writes until it commits.
+
+    Args:
+        connection: Connection to run the DDL on
+        table_name: Range-partitioned parent table
+        month: Any date within the target month
+
+    Returns:
+        Name of the partition (e.g. "advice_outcomes_y2025m11")
+    """
+    if table_name not in PARTITIONED_TABLES:
+        raise ValueError(f"Table '{table_name}' is not range partitioned")
+
+    start = month.replace(day=1)
+    end = _add_months(start, 1)
+    partition_name = f"{table_name}_y{start.year:04d}m{start.month:02d}"
+
+    default_name = f"{table_name}_default"
+
+    if connection.execute(sa.text("SELECT to_regclass(:name)"), {"name": partition_name}).scalar() is not None:
+        return partition_name
+
+    # Block inserts into DEFAULT so no row for this month arrives between the
+    # move and the ATTACH (which re-checks DEFAULT for overlapping rows)
+    connection.execute(sa.text(f"LOCK TABLE {default_name} IN EXCLUSIVE MODE"))
+    connection.execute(sa.text(
+        f"CREATE TABLE {partition_name} (LIKE {table_name} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
+    ))
+    connection.execute(sa.text(
+        f"WITH moved AS ("
+        f"DELETE FROM {default_name} "
+        f"WHERE created_at >= '{start.isoformat()}' AND created_at < '{end.isoformat()}' "
+        f"RETURNING *"
+        f") INSERT INTO {partition_name} SELECT * FROM moved"
+    ))
+    connection.execute(sa.text(
+        f"ALTER TABLE {table_name} ATTACH PARTITION {partition_name} "
+        f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+    ))
+    return partition_name
+
+
+def ensure_monthly_partitions(
+    connection: Connection,
+    months_ahead: int = 2,
+    today: Optional[date] = None
+) -> List[str]:
+    """
+    Ensure every partitioned table has partitions for this month and the next `months_ahead`.
+
+    Args:
+        connection: Connection to run the DDL on
+        months_ahead: Number of future months to create in advance
+        today: Reference date (defaults to the current date)
+
+    Returns:
+        Names of the partitions ensured
+    """
+    current = (today or date.today()).replace(day=1)
+    return [
+        create_monthly_partition(connection, table_name, _add_months(current, offset))
+        for table_name in PARTITIONED_TABLES
+        for offset in range(months_ahead + 1)
+    ]
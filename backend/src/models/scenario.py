@@ -6,7 +6,8 @@ assumptions, and strategy choices.
 """
 
 from typing import Optional, Dict, Any
-from sqlalchemy import Column, String, Text, JSON, ForeignKey, Integer
+from sqlalchemy import Column, String, Text, ForeignKey, Integer, Index, DateTime, text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 
 from .base import BaseModel
@@ -16,6 +17,12 @@ class Scenario(BaseModel):
     """Financial scenario with assumptions and strategy choices."""
 
     __tablename__ = "scenarios"
+    __table_args__ = (
+        Index("ix_scenarios_user_status_updated", "user_profile_id", "status", text("updated_at DESC")),
+        Index("ix_scenarios_last_calculated_at_brin", "last_calculated_at", postgresql_using="brin"),
+        Index("ix_scenarios_tags_gin", "tags", postgresql_using="gin", postgresql_ops={"tags": "jsonb_path_ops"}),
+        Index("ix_scenarios_metadata_gin", "metadata", postgresql_using="gin", postgresql_ops={"metadata": "jsonb_path_ops"}),
+    )
 
     # Identity
     scenario_id = Column(String(255), unique=True, nullable=False, index=True)
@@ -23,29 +30,29 @@ class Scenario(BaseModel):
     description = Column(Text)
 
     # Ownership
-    user_profile_id = Column(Integer, ForeignKey("user_profiles.id"), nullable=False, index=True)
+    user_profile_id = Column(Integer, ForeignKey("user_profiles.id"), nullable=False)
 
     # Scenario state
-    status = Column(String(50), nullable=False, default="DRAFT")  # DRAFT, ACTIVE, ARCHIVED, DELETED
-    version = Column(String(20), nullable=False, default="1.0")
+    status = Column(String(50), nullable=False, default="DRAFT", server_default="DRAFT")  # DRAFT, ACTIVE, ARCHIVED, DELETED
+    version = Column(String(20), nullable=False, default="1.0", server_default="1.0")
 
     # Financial data (stored as JSON for flexibility)
-    calculation_state = Column(JSON)  # Complete CalculationState snapshot
-    assumption_set = Column(JSON)     # AssumptionSet configuration
+    calculation_state = Column(JSONB)  # Complete CalculationState snapshot
+    assumption_set = Column(JSONB)     # AssumptionSet configuration
 
     # Strategy configuration
-    strategy_config = Column(JSON)    # Strategy model configuration
+    strategy_config = Column(JSONB)    # Strategy model configuration
 
     # Execution mode (from workflows_and_modes.md)
-    mode = Column(String(100), nullable=False, default="MODE-FACT-CHECK")
+    mode = Column(String(100), nullable=False, default="MODE-FACT-CHECK", server_default="MODE-FACT-CHECK")
 
     # Results and caching
-    projection_output = Column(JSON)  # Cached ProjectionOutput
-    last_calculated_at = Column(String(25))  # ISO timestamp
+    projection_output = Column(JSONB)  # Cached ProjectionOutput
+    last_calculated_at = Column(DateTime(timezone=True))
 
     # Metadata
-    tags = Column(JSON, default=list)  # List of tags for organization
-    scenario_metadata = Column(JSON, default=dict)  # Additional metadata
+    tags = Column(JSONB, default=list)  # List of tags for organization
+    scenario_metadata = Column("metadata", JSONB, default=dict)  # Additional metadata
 
     # Audit trail
     created_by_clerk_id = Column(String(255), nullable=False)
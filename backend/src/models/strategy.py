@@ -6,7 +6,8 @@ and constraints used by the Strategy Engine.
 """
 
 from typing import Optional, Dict, Any, Literal
-from sqlalchemy import Column, String, Text, JSON, Boolean
+from sqlalchemy import Column, String, Text, Boolean, Index, true
+from sqlalchemy.dialects.postgresql import JSONB
 
 from .base import BaseModel
 
@@ -15,6 +16,10 @@ class Strategy(BaseModel):
     """Optimization template and constraints for Strategy Engine."""
 
     __tablename__ = "strategies"
+    __table_args__ = (
+        Index("ix_strategies_constraints_gin", "constraints", postgresql_using="gin", postgresql_ops={"constraints": "jsonb_path_ops"}),
+        Index("ix_strategies_tags_gin", "tags", postgresql_using="gin", postgresql_ops={"tags": "jsonb_path_ops"}),
+    )
 
     # Identity
     strategy_id = Column(String(255), unique=True, nullable=False, index=True)
@@ -26,16 +31,16 @@ class Strategy(BaseModel):
     target_metric = Column(String(50), nullable=False)  # NET_WEALTH, CASHFLOW_SURPLUS, RETIREMENT_AGE
 
     # Configuration
-    constraints = Column(JSON, default=dict)  # Strategy constraints and limits
-    parameters = Column(JSON, default=dict)  # Tunable parameters for optimization
+    constraints = Column(JSONB, default=dict)  # Strategy constraints and limits
+    parameters = Column(JSONB, default=dict)  # Tunable parameters for optimization
 
     # Status and availability
-    is_active = Column(Boolean, default=True, nullable=False)
-    is_template = Column(Boolean, default=True, nullable=False)  # True for reusable templates
+    is_active = Column(Boolean, default=True, server_default=true(), nullable=False)
+    is_template = Column(Boolean, default=True, server_default=true(), nullable=False)  # True for reusable templates
 
     # Metadata
-    version = Column(String(20), nullable=False, default="1.0")
-    tags = Column(JSON, default=list)  # Categorization tags
+    version = Column(String(20), nullable=False, default="1.0", server_default="1.0")
+    tags = Column(JSONB, default=list)  # Categorization tags
 
     # Audit
     created_by_clerk_id = Column(String(255), nullable=False)
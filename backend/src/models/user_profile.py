@@ -6,7 +6,8 @@ roles, and permissions in the multi-user financial advice system.
 """
 
 from typing import Optional, Literal
-from sqlalchemy import Column, String, Boolean, JSON, ForeignKey
+from sqlalchemy import Column, String, Boolean, ForeignKey, Index, Date, DateTime, true
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 
 from .base import BaseModel
@@ -16,6 +17,10 @@ class UserProfile(BaseModel):
     """User profile with role-based access control."""
 
     __tablename__ = "user_profiles"
+    __table_args__ = (
+        Index("ix_user_profiles_last_login_at_brin", "last_login_at", postgresql_using="brin"),
+        Index("ix_user_profiles_permissions_gin", "permissions", postgresql_using="gin", postgresql_ops={"permissions": "jsonb_path_ops"}),
+    )
 
     # Clerk authentication integration
     clerk_id = Column(String(255), unique=True, nullable=False, index=True)
@@ -27,8 +32,8 @@ class UserProfile(BaseModel):
     display_name = Column(String(200))
 
     # Role-based access control
-    role = Column(String(50), nullable=False, default="CLIENT")  # CLIENT, ADVISER, COMPLIANCE_OFFICER, ADMIN
-    is_active = Column(Boolean, default=True, nullable=False)
+    role = Column(String(50), nullable=False, default="CLIENT", server_default="CLIENT")  # CLIENT, ADVISER, COMPLIANCE_OFFICER, ADMIN
+    is_active = Column(Boolean, default=True, server_default=true(), nullable=False)
 
     # Organization/Practice management (for advisers)
     organization_id = Column(String(255), index=True)  # Links to practice/organization
@@ -37,14 +42,14 @@ class UserProfile(BaseModel):
     # Professional credentials
     afsl_number = Column(String(50))  # Australian Financial Services Licence
     aflp_number = Column(String(50))  # Australian Financial Licence for Advisers
-    certification_expiry = Column(String(10))  # YYYY-MM-DD format
+    certification_expiry = Column(Date)
 
     # Permissions and settings
-    permissions = Column(JSON, default=dict)  # Flexible permission structure
-    preferences = Column(JSON, default=dict)  # User preferences and settings
+    permissions = Column(JSONB, default=dict)  # Flexible permission structure
+    preferences = Column(JSONB, default=dict)  # User preferences and settings
 
     # Audit fields
-    last_login_at = Column(String(25))  # ISO timestamp
+    last_login_at = Column(DateTime(timezone=True))
     created_by_clerk_id = Column(String(255))  # Who created this profile
 
     # Relationships
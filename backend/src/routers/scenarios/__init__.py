@@ -119,7 +119,7 @@ async def get_scenario(
         "mode": scenario.mode,
         "calculation_state": scenario.calculation_state,
         "projection_output": scenario.projection_output,
-        "last_calculated_at": scenario.last_calculated_at,
+        "last_calculated_at": scenario.last_calculated_at.isoformat() if scenario.last_calculated_at else None,
         "tags": scenario.tags or [],
         "created_at": scenario.created_at.isoformat(),
         "updated_at": scenario.updated_at.isoformat()
@@ -215,5 +215,5 @@ async def get_scenario_results(
     return {
         "scenario_id": scenario.scenario_id,
         "projection_output": scenario.projection_output,
-        "last_calculated_at": scenario.last_calculated_at
+        "last_calculated_at": scenario.last_calculated_at.isoformat() if scenario.last_calculated_at else None
     }
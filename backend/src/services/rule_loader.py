@@ -8,10 +8,13 @@ rather than hardcoding values, enabling dynamic rule updates and compliance.
 import os
 import json
 import yaml
-from typing import Dict, Any, Optional, List
+from contextlib import contextmanager
+from functools import cache
+from typing import Dict, Any, Optional, List, Iterator, Callable, Tuple
 from pathlib import Path
 from decimal import Decimal
 from dataclasses import dataclass
+import numpy as np
 
 
 @dataclass
@@ -21,6 +24,11 @@ class TaxRuleSet:
     medicare_levy_rate: Decimal
     medicare_levy_thresholds: Dict[str, Decimal]
     lito_parameters: Dict[str, Decimal]
+    # Brackets as float64 arrays sorted by 'min': cumulative lower bound,
+    # width and rate of each band, for vectorised progressive tax
+    bracket_lowers: np.ndarray
+    bracket_widths: np.ndarray
+    bracket_rates: np.ndarray
 
 
 @dataclass
@@ -76,6 +84,8 @@ class RuleLoader:
         self.config_dir = Path(config_dir)
         self._rules_cache: Optional[CalculationRules] = None
         self._cache_timestamp: Optional[float] = None
+        self._batch_depth = 0
+        self._reload_callbacks: List[Callable[[CalculationRules], None]] = []
 
     def load_rules(self, force_reload: bool = False) -> CalculationRules:
         """
@@ -92,9 +102,9 @@ class RuleLoader:
             ValueError: If configuration data is invalid
         """
         # Check if we have cached rules and they're still valid
+        # Inside a calculation batch the rules are pinned, so skip the mtime probe
         if not force_reload and self._rules_cache is not None:
-            config_modified = self._check_config_modified()
-            if not config_modified:
+            if self._batch_depth or not self._check_config_modified():
                 return self._rules_cache
 
         # Load rules from files
@@ -113,8 +123,47 @@ class RuleLoader:
         # Update cache timestamp
         self._cache_timestamp = self._get_latest_modification_time()
 
+        # Drop memoised getter results derived from the previous rules
+        for getter in _MEMOISED_GETTERS:
+            getter.cache_clear()
+
+        for callback in self._reload_callbacks:
+            callback(self._rules_cache)
+
         return self._rules_cache
 
+    def on_reload(self, callback: Callable[[CalculationRules], None]) -> None:
+        """
+        Register a callback invoked with the new rules whenever they are (re)loaded.
+
+        Modules that specialise on rule values bind them as constants through
+        this hook. The callback is called immediately with the current rules.
+
+        Args:
+            callback: Function receiving the loaded CalculationRules
+        """
+        self._reload_callbacks.append(callback)
+        callback(self.load_rules())
+
+    @contextmanager
+    def calculation_batch(self) -> Iterator[CalculationRules]:
+        """
+        Pin the loaded rules for the duration of a calculation batch.
+
+        Rule values are constant within a run, so getters called inside the
+        block return the cached rules without re-checking configuration file
+        modification times on every call.
+
+        Yields:
+            The CalculationRules in effect for the batch
+        """
+        rules = self.load_rules()
+        self._batch_depth += 1
+        try:
+            yield rules
+        finally:
+            self._batch_depth -= 1
+
     def _load_tax_rules(self) -> TaxRuleSet:
         """Load tax calculation rules from tax-rules.yaml/json."""
         config_file = self._find_config_file("tax-rules")
@@ -134,6 +183,8 @@ class RuleLoader:
                 "max": Decimal(str(bracket.get("max", "inf"))) if bracket.get("max") else None,
                 "rate": Decimal(str(bracket["rate"]))
             })
+        # Sort once at load; every consumer relies on ascending 'min' order
+        brackets.sort(key=lambda bracket: bracket["min"])
 
         # Parse Medicare levy settings
         medicare_config = config_data["medicare_levy"]
@@ -152,13 +203,41 @@ class RuleLoader:
             "phase_out_end": Decimal(str(lito_config.get("phase_out_end", 67500))),
             "phase_out_rate": Decimal(str(lito_config.get("phase_out_rate", 0.05)))
         }
+        # Income at which the phase-out reduces the offset to nil
+        lito_parameters["phase_out_limit"] = (
+            lito_parameters["phase_out_start"]
+            + lito_parameters["max_offset"] / lito_parameters["phase_out_rate"]
+            if lito_parameters["phase_out_rate"] else Decimal("Infinity")
+        )
+
+        bracket_lowers, bracket_widths, bracket_rates = self._build_bracket_arrays(brackets)
 
         return TaxRuleSet(
             brackets=brackets,
             medicare_levy_rate=medicare_levy_rate,
             medicare_levy_thresholds=thresholds,
-            lito_parameters=lito_parameters
+            lito_parameters=lito_parameters,
+            bracket_lowers=bracket_lowers,
+            bracket_widths=bracket_widths,
+            bracket_rates=bracket_rates
+        )
+
+    @staticmethod
+    def _build_bracket_arrays(brackets: List[Dict[str, Any]]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Convert tax brackets, already sorted by 'min', into float64
+        (lowers, widths, rates) arrays.
+
+        Each band consumes up to (max - min) of income in order, so a band's
+        lower bound is the cumulative width of the bands below it.
+        """
+        widths = np.array(
+            [float(b["max"] - b["min"]) if b["max"] is not None else np.inf for b in brackets],
+            dtype=np.float64
         )
+        rates = np.array([float(b["rate"]) for b in brackets], dtype=np.float64)
+        lowers = np.concatenate(([0.0], np.cumsum(widths[:-1])))
+        return lowers, widths, rates
 
     def _load_super_rules(self) -> SuperRuleSet:
         """Load superannuation calculation rules."""
@@ -235,21 +314,31 @@ class RuleLoader:
 
         return latest_time
 
+    @cache
     def get_tax_brackets(self) -> List[Dict[str, Any]]:
-        """Get tax brackets for progressive tax calculations."""
+        """Get tax brackets for progressive tax calculations, sorted by 'min'."""
         rules = self.load_rules()
         return rules.tax.brackets
 
+    @cache
+    def get_tax_bracket_arrays(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Get tax brackets as float64 (lowers, widths, rates) arrays."""
+        rules = self.load_rules()
+        return rules.tax.bracket_lowers, rules.tax.bracket_widths, rules.tax.bracket_rates
+
+    @cache
     def get_medicare_levy_rate(self) -> Decimal:
         """Get Medicare levy rate."""
         rules = self.load_rules()
         return rules.tax.medicare_levy_rate
 
+    @cache
     def get_medicare_levy_thresholds(self) -> Dict[str, Decimal]:
         """Get Medicare levy thresholds."""
         rules = self.load_rules()
         return rules.tax.medicare_levy_thresholds
 
+    @cache
     def get_lito_parameters(self) -> Dict[str, Decimal]:
         """Get LITO calculation parameters."""
         rules = self.load_rules()
@@ -286,5 +375,15 @@ class RuleLoader:
         return rules.property.marginal_tax_rate
 
 
+# Hot-path getters memoised per loader; cleared by load_rules() on reload
+_MEMOISED_GETTERS = (
+    RuleLoader.get_tax_brackets,
+    RuleLoader.get_tax_bracket_arrays,
+    RuleLoader.get_medicare_levy_rate,
+    RuleLoader.get_medicare_levy_thresholds,
+    RuleLoader.get_lito_parameters,
+)
+
+
 # Global rule loader instance
 rule_loader = RuleLoader()
@@ -7,7 +7,7 @@ including creation, retrieval, updates, and deletion operations.
 
 import uuid
 from typing import List, Optional, Dict, Any
-from datetime import datetime
+from datetime import datetime, timezone
 
 from sqlalchemy.orm import Session
 from sqlalchemy import and_, or_
@@ -161,7 +161,7 @@ class ScenarioService:
             scenario_id=scenario_id,
             updates={
                 'calculation_state': calculation_state.model_dump(),
-                'last_calculated_at': datetime.now().isoformat()
+                'last_calculated_at': datetime.now(timezone.utc)
             },
             updated_by_clerk_id=updated_by_clerk_id
         )
@@ -187,7 +187,7 @@ class ScenarioService:
             scenario_id=scenario_id,
             updates={
                 'projection_output': projection_output,
-                'last_calculated_at': datetime.now().isoformat()
+                'last_calculated_at': datetime.now(timezone.utc)
             },
             updated_by_clerk_id=updated_by_clerk_id
         )
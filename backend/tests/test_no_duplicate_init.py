@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+
+import sys
+import os
+
+# Backend root (the directory added to sys.path by the other test scripts)
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+PACKAGES = ['calculation_engine', 'src']
+
+
+def find_duplicate_import_paths(root):
+    """Return import paths provided by both `name.py` and `name/__init__.py`."""
+    duplicates = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d != '__pycache__']
+        for dirname in dirnames:
+            if (
+                f'{dirname}.py' in filenames
+                and os.path.isfile(os.path.join(dirpath, dirname, '__init__.py'))
+            ):
+                module_path = os.path.relpath(os.path.join(dirpath, dirname), BACKEND_DIR)
+                duplicates.append(module_path.replace(os.sep, '.'))
+    return duplicates
+
+
+duplicates = []
+for package in PACKAGES:
+    duplicates.extend(find_duplicate_import_paths(os.path.join(BACKEND_DIR, package)))
+
+if duplicates:
+    for module_path in duplicates:
+        print(f'FAIL: {module_path} is defined by both a module and a package __init__.py')
+    sys.exit(1)
+
+print('PASS: No duplicate __init__ import paths')
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+
+import sys
+import os
+from datetime import date
+from decimal import Decimal
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+try:
+    from calculation_engine.registry import run_calculation
+    from calculation_engine.schemas import CashflowContext, EntityCashflow, EntityContext, FinancialPositionContext
+    from calculation_engine.schemas.calculation import CalculationState, GlobalContext
+
+    global_context = GlobalContext(
+        financial_year=2025,
+        effective_date=date(2025, 7, 1),
+        inflation_rate=Decimal('0.03'),
+        wage_growth_rate=Decimal('0.035'),
+        property_growth_rate=Decimal('0.05'),
+        equity_return_rate=Decimal('0.07'),
+        fixed_income_return_rate=Decimal('0.04'),
+        cash_return_rate=Decimal('0.02'),
+        discount_rate=Decimal('0.05'),
+        tax_brackets=[],
+        medicare_levy_rate=Decimal('0.02'),
+        medicare_levy_thresholds={},
+        concessional_cap=30000,
+        non_concessional_cap=120000,
+        tbc_general_cap=1900000,
+    )
+    state = CalculationState(
+        global_context=global_context,
+        entity_context=EntityContext(),
+        position_context=FinancialPositionContext(),
+        cashflow_context=CashflowContext(flows={
+            'p1': EntityCashflow(entity_id='p1', salary_wages_gross=Decimal('95000')),
+        }),
+        scenario_id='test',
+        assumption_set_id='test',
+    )
+
+    result = run_calculation('CAL-PIT-001', state, 'p1')
+    if not result.success:
+        print(f'FAIL: CAL-PIT-001 did not run: {result.error_message}')
+        sys.exit(1)
+
+    # EntityCashflow has no PAYG withheld, so the whole liability is payable
+    result = run_calculation('CAL-PIT-005', state, 'p1')
+    tax_results = state.intermediates.tax_results['p1']
+    expected = round(
+        float(tax_results['payg_tax'])
+        + float(tax_results.get('medicare_levy', 0))
+        - float(tax_results.get('tax_offsets', 0)),
+        2,
+    )
+    if not result.success:
+        print(f'FAIL: CAL-PIT-005 failed on an EntityCashflow: {result.error_message}')
+        sys.exit(1)
+    if abs(float(result.value) - expected) > 0.005:
+        print(f'FAIL: CAL-PIT-005 returned {result.value}, expected {expected}')
+        sys.exit(1)
+    print(f'PASS: CAL-PIT-005 net tax payable {result.value}')
+
+    result = run_calculation('CAL-PIT-005', state, 'missing')
+    if result.success:
+        print('FAIL: CAL-PIT-005 succeeded for an entity with no cashflow')
+        sys.exit(1)
+    print('PASS: CAL-PIT-005 fails for an entity with no cashflow')
+
+    print('\nSUCCESS: CAL-PIT-005 validation PASSED!')
+
+except ImportError as e:
+    print(f'FAIL: Import error: {e}')
+    sys.exit(1)
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+
+import sys
+import os
+import tempfile
+from pathlib import Path
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from create_script_tracking import TrackingEntryGenerator
+
+FILES = {
+    'pkg/__init__.py': 'from . import alpha, beta, helper\n',
+    'pkg/alpha.py': 'from .beta import run\n',
+    'pkg/beta.py': 'def run():\n    pass\n',
+    'pkg/sub/__init__.py': 'from .. import helper\n',
+}
+
+
+def interacts_with(generator, root, script_name):
+    return generator._analyze_dependencies(root / script_name, Path(script_name))
+
+
+with tempfile.TemporaryDirectory() as tmp:
+    root = Path(tmp)
+    for script_name, source in FILES.items():
+        (root / script_name).parent.mkdir(parents=True, exist_ok=True)
+        (root / script_name).write_text(source)
+
+    generator = TrackingEntryGenerator(root)
+    cases = [
+        # from . import x resolves each name to its submodule, not to the
+        # importing package itself
+        ('pkg/__init__.py', ['pkg/alpha.py', 'pkg/beta.py']),
+        ('pkg/alpha.py', ['pkg/beta.py']),
+        # a name the parent package defines resolves to its __init__.py
+        ('pkg/sub/__init__.py', ['pkg/__init__.py']),
+    ]
+
+    failed = False
+    for script_name, expected in cases:
+        actual = interacts_with(generator, root, script_name)
+        if actual == expected:
+            print(f'PASS: {script_name} -> {actual}')
+        else:
+            print(f'FAIL: {script_name} -> {actual}, expected {expected}')
+            failed = True
+
+if failed:
+    sys.exit(1)
+
+print('\nSUCCESS: Relative import resolution PASSED!')